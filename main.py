@@ -7,106 +7,404 @@ import os
 import pandas as pd
 import logging
 import argparse
-from datetime import datetime
-from utils.extract import extract_data
-from utils.transform import transform_data
-from utils.load import load_data, LoadError
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f"etl_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"),
-        logging.StreamHandler()
-    ]
-)
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from utils.extract import extract_pages
+from utils.transform import transform_data, combine_chunks
+from utils.load import load_data
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 logger = logging.getLogger(__name__)
 
-def main():
-    """Main ETL process."""
+# Directory for locally cached pipeline artifacts
+CACHE_DIR = '.cache'
+
+# Marks the end of the page stream on the extract -> transform queue
+_END_OF_PAGES = object()
+
+def extract_and_transform(max_queued_pages=4, parse_workers=0):
+    """
+    Run extraction and transformation as a producer/consumer pipeline.
+    
+    A producer thread scrapes pages and puts them on a bounded queue while a
+    consumer thread transforms each page as soon as it arrives, so page fetch
+    latency is hidden behind transform work. The bounded queue applies
+    backpressure so memory stays flat if transform falls behind.
+    
+    Args:
+        max_queued_pages: Maximum number of extracted pages waiting for transform
+        parse_workers: Number of processes that parse pages, 0 parses in the
+            producer thread
+    
+    Returns:
+        tuple: (number of extracted records, transformed DataFrame)
+    """
+    pages = queue.Queue(maxsize=max_queued_pages)
+    # Set when the consumer fails, so the producer stops instead of blocking on a full queue
+    stop = threading.Event()
+    
+    def put(item):
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        page_frames = extract_pages(parse_workers)
+        try:
+            for page_df in page_frames:
+                if not put(page_df):
+                    break
+        finally:
+            try:
+                page_frames.close()
+            finally:
+                put(_END_OF_PAGES)
+    
+    def consume():
+        extracted_count = 0
+        chunks = []
+        try:
+            while True:
+                page_df = pages.get()
+                if page_df is _END_OF_PAGES:
+                    return extracted_count, chunks
+                extracted_count += len(page_df)
+                transformed_chunk = transform_data(page_df)
+                if not transformed_chunk.empty:
+                    chunks.append(transformed_chunk)
+        except BaseException:
+            stop.set()
+            raise
+    
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        producer = ex.submit(produce)
+        consumer = ex.submit(consume)
+        extracted_count, chunks = consumer.result()
+        producer.result()
+    
+    transformed_data = combine_chunks(chunks)
+    return extracted_count, transformed_data
+
+def read_cached_transform(cache_file, max_age_hours):
+    """
+    Read the transformed DataFrame from the Parquet cache.
+    
+    Returns None when the cache file is missing, older than max_age_hours
+    or cannot be read. A max_age_hours of None accepts a cache of any age.
+    """
+    if not os.path.exists(cache_file):
+        logger.info("No cached transformed data found at %s", cache_file)
+        return None
+    
+    age_hours = (datetime.now().timestamp() - os.path.getmtime(cache_file)) / 3600
+    if max_age_hours is not None and age_hours > max_age_hours:
+        logger.info("Cached transformed data is %.1f hours old, ignoring it", age_hours)
+        return None
+    
     try:
-        # Step 1: Extract raw data
-        logger.info("Starting data extraction...")
-        raw_data = extract_data()
-        if raw_data.empty:
-            logger.error("Data extraction returned empty DataFrame. Aborting.")
-            return False
-        logger.info(f"Data extraction completed. {len(raw_data)} records extracted.")
+        return pd.read_parquet(cache_file)
+    except Exception as e:
+        logger.warning("Failed to read cached transformed data: %s", e)
+        return None
+
+def write_transform_cache(df, cache_file):
+    """Write the transformed DataFrame to the Parquet cache."""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        df.to_parquet(cache_file, index=False)
+        logger.info("Transformed data cached to %s", cache_file)
+    except Exception as e:
+        logger.warning("Failed to cache transformed data: %s", e)
+
+def setup_logging(log_file=None):
+    """
+    Install the console handler and, if requested, a log file handler.
+    
+    Safe to call more than once: handlers that are already installed on the
+    root logger are not added again.
+    """
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    formatter = logging.Formatter(LOG_FORMAT)
+    
+    if not any(type(h) is logging.StreamHandler for h in root_logger.handlers):
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        root_logger.addHandler(stream_handler)
+    
+    if log_file:
+        log_path = os.path.abspath(log_file)
+        if not any(isinstance(h, logging.FileHandler) and h.baseFilename == log_path
+                   for h in root_logger.handlers):
+            file_handler = logging.FileHandler(log_path)
+            file_handler.setFormatter(formatter)
+            root_logger.addHandler(file_handler)
+
+def parse_date_range(value):
+    """
+    Parse a 'YYYY-MM-DD' date or an inclusive 'YYYY-MM-DD:YYYY-MM-DD' range.
+    
+    Returns:
+        list: Dates in the range as 'YYYY-MM-DD' strings
+    """
+    start_str, _, end_str = value.partition(':')
+    try:
+        start = datetime.strptime(start_str, '%Y-%m-%d')
+        end = datetime.strptime(end_str, '%Y-%m-%d') if end_str else start
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date range '{value}', expected YYYY-MM-DD[:YYYY-MM-DD]")
+    if end < start:
+        raise argparse.ArgumentTypeError(f"Invalid date range '{value}', end date is before start date")
+    return [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end - start).days + 1)]
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the fashion products ETL pipeline.")
+    parser.add_argument('--use-cache', action='store_true',
+                        help="Reuse today's cached transformed data and skip extract/transform")
+    parser.add_argument('--cache-max-age', type=float, default=24,
+                        help="Maximum age in hours of the cached transformed data (default: 24)")
+    
+    destinations = parser.add_argument_group(
+        'destinations', "Select where to load the data (default: --csv --sheets --postgres)")
+    destinations.add_argument('--csv', action='store_true', help="Save the data as a CSV file")
+    destinations.add_argument('--parquet', action='store_true',
+                              help="Save the data as a zstd-compressed Parquet file")
+    destinations.add_argument('--sheets', action='store_true', help="Upload the data to Google Sheets")
+    destinations.add_argument('--postgres', action='store_true', help="Save the data to PostgreSQL")
+    
+    sheets = parser.add_argument_group('Google Sheets')
+    sheets.add_argument('--sheets-creds', default='google-sheets-api.json',
+                        help="Path to the service account credentials JSON (default: google-sheets-api.json)")
+    sheets.add_argument('--sheets-id', default='173byRKN5zsxFwCp3-tL0W4A4t9fYqjIx0CYdVjEJirk',
+                        help="ID of the target Google Sheet")
+    
+    postgres = parser.add_argument_group('PostgreSQL')
+    postgres.add_argument('--pg-host', default='localhost', help="PostgreSQL host (default: localhost)")
+    postgres.add_argument('--pg-port', type=int, default=5432, help="PostgreSQL port (default: 5432)")
+    postgres.add_argument('--pg-database', default='fashion_data',
+                          help="PostgreSQL database (default: fashion_data)")
+    postgres.add_argument('--pg-user', default='etl_user', help="PostgreSQL user (default: etl_user)")
+    postgres.add_argument('--pg-pass', default='irfn321', help="PostgreSQL password")
+    
+    parser.add_argument('--force', action='store_true',
+                        help="Load to every destination even if it already holds the same data")
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help="Parse pages in this many worker processes (default: 0, parse in-process)")
+    parser.add_argument('--dates', type=parse_date_range, default=None,
+                        help="Backfill one ETL run per day, e.g. 2024-01-01:2024-01-31, in parallel processes")
+    parser.add_argument('--log-file', nargs='?', default=None,
+                        const=f"etl_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+                        help="Also write logs to a file (default name: etl_log_YYYYMMDD_HHMMSS.log)")
+    parser.add_argument('--verbose', action='store_true',
+                        help="Enable debug logging and print a preview of the loaded data")
+    
+    args = parser.parse_args(argv)
+    if args.parse_workers < 0:
+        parser.error("--parse-workers must be 0 or more")
+    if args.dates and not args.use_cache:
+        # The source site has no per-date data, so a backfill can only reload cached transforms
+        parser.error("--dates requires --use-cache")
+    if args.parse_workers and args.dates:
+        # Backfill runs are daemonic pool processes, which cannot start workers of their own
+        parser.error("--parse-workers cannot be combined with --dates")
+    validate_destinations(parser, args)
+    return args
+
+def validate_destinations(parser, args):
+    """
+    Check the destination configuration before any work starts.
+    
+    Selects the default destinations when none is given. An explicitly
+    selected destination with missing configuration exits with status 2 right
+    away, instead of failing at the load step after a full extract and
+    transform. Google Sheets is dropped with a warning when it is only a
+    default and its credentials file is missing.
+    """
+    explicit_sheets = args.sheets
+    if not any([args.csv, args.parquet, args.sheets, args.postgres]):
+        args.csv = args.sheets = args.postgres = True
+    
+    if args.sheets:
+        if not args.sheets_creds:
+            parser.error("--sheets requires --sheets-creds")
+        if not os.path.exists(args.sheets_creds):
+            if explicit_sheets:
+                parser.error(f"Google Sheets credentials file not found: {args.sheets_creds}")
+            logger.warning("Google Sheets credentials file not found: %s, skipping Google Sheets",
+                           args.sheets_creds)
+            args.sheets = False
+    
+    if args.postgres and not all([args.pg_user, args.pg_pass]):
+        parser.error("--postgres requires --pg-user and --pg-pass")
+
+def run_one(date_str, args):
+    """
+    Run the ETL process once.
+    
+    Args:
+        date_str: Backfill date as 'YYYY-MM-DD', or None for a regular run.
+            The date keys the transform cache and namespaces the CSV file,
+            worksheet, PostgreSQL table and log file of the run.
+        args: Parsed command line arguments
+        
+    Returns:
+        bool: True if the run succeeded
+    """
+    date_tag = (datetime.strptime(date_str, '%Y-%m-%d') if date_str else datetime.now()).strftime('%Y%m%d')
+    name_suffix = f"_{date_tag}" if date_str else ""
+    
+    log_file = args.log_file
+    if log_file and date_str:
+        log_root, log_ext = os.path.splitext(log_file)
+        log_file = f"{log_root}{name_suffix}{log_ext}"
+    setup_logging(log_file)
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
+    try:
+        cache_file = os.path.join(CACHE_DIR, f"transformed_{date_tag}.parquet")
+        
+        transformed_data = None
+        if args.use_cache:
+            # A backfill cache is keyed by its own date, so its age does not make it stale
+            max_age = None if date_str else args.cache_max_age
+            transformed_data = read_cached_transform(cache_file, max_age)
+            if transformed_data is not None:
+                logger.info("Loaded %d cached records from %s, skipping extract and transform.",
+                            len(transformed_data), cache_file)
         
-        # Step 2: Transform data
-        logger.info("Starting data transformation...")
-        transformed_data = transform_data(raw_data)
-        if transformed_data.empty:
-            logger.error("Data transformation returned empty DataFrame. Aborting.")
+        if transformed_data is None and date_str:
+            # The source site has no per-date data, scraping would load today's products under this date
+            logger.error("No cached transform for %s at %s, skipping this date.", date_str, cache_file)
             return False
-        logger.info(f"Data transformation completed. {len(transformed_data)} valid records after transformation.")
+        
+        if transformed_data is None:
+            # Step 1 & 2: Extract raw data and transform it page by page
+            logger.info("Starting data extraction and transformation...")
+            extracted_count, transformed_data = extract_and_transform(parse_workers=args.parse_workers)
+            if extracted_count == 0:
+                logger.error("Data extraction returned empty DataFrame. Aborting.")
+                return False
+            logger.info("Data extraction completed. %d records extracted.", extracted_count)
+            
+            if transformed_data.empty:
+                logger.error("Data transformation returned empty DataFrame. Aborting.")
+                return False
+            logger.info("Data transformation completed. %d valid records after transformation.", len(transformed_data))
+            
+            write_transform_cache(transformed_data, cache_file)
         
         # Step 3: Load data to all destinations
         logger.info("Starting data loading to all destinations...")
         
-        # Hardcoded configuration parameters
         csv_path = './'
-        csv_filename = f"products.csv"
+        csv_filename = f"products{name_suffix}.csv"
+        parquet_filename = f"products{name_suffix}.parquet"
         
-        sheets_credentials_path = 'google-sheets-api.json'
-        sheets_id = '173byRKN5zsxFwCp3-tL0W4A4t9fYqjIx0CYdVjEJirk'
-        sheets_name = 'Products'
+        sheets_name = f"Products{name_suffix}"
         
         postgres_params = {
-            'host': 'localhost',
-            'database': 'fashion_data',
-            'user': 'etl_user',
-            'password': 'irfn321',
-            'port': 5432
+            'host': args.pg_host,
+            'database': args.pg_database,
+            'user': args.pg_user,
+            'password': args.pg_pass,
+            'port': args.pg_port
         }
-        postgres_table = 'products'
+        postgres_table = f"products{name_suffix}"
         
-        # Execute load operation to all destinations
+        # Execute load operation to all destinations in parallel
         results = load_data(
             transformed_data,
-            save_csv=True,
-            save_sheets=True,
-            save_postgres=True,
+            save_csv=args.csv,
+            save_sheets=args.sheets,
+            save_postgres=args.postgres,
             csv_path=csv_path,
             csv_filename=csv_filename,
-            sheets_credentials_path=sheets_credentials_path,
-            sheets_id=sheets_id,
+            sheets_credentials_path=args.sheets_creds,
+            sheets_id=args.sheets_id,
             sheets_name=sheets_name,
             postgres_params=postgres_params,
-            postgres_table=postgres_table
+            postgres_table=postgres_table,
+            save_parquet=args.parquet,
+            parquet_path=csv_path,
+            parquet_filename=parquet_filename,
+            # One state file per backfill date, so parallel runs never write the same file
+            state_path=os.path.join(CACHE_DIR, f"load_state{name_suffix}.json"),
+            force=args.force
         )
         
         # Log results
-        if results.get('csv_path'):
-            logger.info(f"Data successfully saved to CSV: {results['csv_path']}")
-        else:
-            logger.error(f"Failed to save to CSV: {results.get('csv_error', 'Unknown error')}")
-            
-        if results.get('sheets_id'):
-            logger.info(f"Data successfully saved to Google Sheets. ID: {results['sheets_id']}")
-        else:
-            logger.error(f"Failed to save to Google Sheets: {results.get('sheets_error', 'Unknown error')}")
-            
-        if results.get('postgres_success'):
-            logger.info(f"Data successfully saved to PostgreSQL table: {postgres_table}")
-        else:
-            logger.error(f"Failed to save to PostgreSQL: {results.get('postgres_error', 'Unknown error')}")
+        if args.csv:
+            if results.get('csv_path'):
+                logger.info("Data successfully saved to CSV: %s", results['csv_path'])
+            else:
+                logger.error("Failed to save to CSV: %s", results.get('csv_error', 'Unknown error'))
+        
+        if args.parquet:
+            if results.get('parquet_path'):
+                logger.info("Data successfully saved to Parquet: %s", results['parquet_path'])
+            else:
+                logger.error("Failed to save to Parquet: %s", results.get('parquet_error', 'Unknown error'))
+        
+        if args.sheets:
+            if results.get('sheets_id'):
+                logger.info("Data successfully saved to Google Sheets. ID: %s", results['sheets_id'])
+            else:
+                logger.error("Failed to save to Google Sheets: %s", results.get('sheets_error', 'Unknown error'))
+        
+        if args.postgres:
+            if results.get('postgres_success'):
+                logger.info("Data successfully saved to PostgreSQL table: %s", postgres_table)
+            else:
+                logger.error("Failed to save to PostgreSQL: %s", results.get('postgres_error', 'Unknown error'))
+        
+        if results.get('skipped'):
+            logger.info("Unchanged since the last load, skipped: %s (use --force to reload)",
+                        ", ".join(results['skipped']))
         
         logger.info("ETL process completed successfully!")
         
-        # Display head of the saved data
-        logger.info("Displaying first few rows of the saved data:")
-        print(transformed_data.head())
+        # Preview the saved data only when debugging, DataFrame.info() scans every column
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Displaying first few rows of the saved data:")
+            print(transformed_data.head())
 
-        # Display info of the saved data
-        logger.info("Displaying dataframe structure:")
-        print(transformed_data.info())
+            logger.debug("Displaying dataframe structure:")
+            transformed_data.info()
         
         return True
     except Exception as e:
-        logger.error(f"ETL process failed: {str(e)}")
+        logger.error("ETL process failed: %s", e)
+        return False
+
+def main(argv=None):
+    """Main ETL process."""
+    args = parse_args(argv)
+    if not args.dates:
+        return run_one(None, args)
+    
+    # Backfill: the daily runs are independent, run them in parallel processes.
+    # One task per child process so each day's log file handler stays separate.
+    setup_logging()
+    logger.info("Starting backfill of %d days: %s to %s", len(args.dates), args.dates[0], args.dates[-1])
+    with multiprocessing.Pool(processes=min(8, len(args.dates)), maxtasksperchild=1) as pool:
+        results = pool.starmap(run_one, [(date_str, args) for date_str in args.dates])
+    
+    failed_dates = [date_str for date_str, success in zip(args.dates, results) if not success]
+    if failed_dates:
+        logger.error("Backfill failed for %d days: %s", len(failed_dates), ', '.join(failed_dates))
         return False
+    logger.info("Backfill completed successfully!")
+    return True
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 import unittest
 from unittest.mock import patch, Mock
+import os
+import tempfile
+import shutil
 import pandas as pd
 from bs4 import BeautifulSoup
 import logging
-from utils.extract import get_page_content, parse_product_card, extract_data
+from utils.extract import get_page_content, parse_product_card, extract_data, extract_pages, page_url
 from requests.exceptions import RequestException
 
 # Suppress logging during tests
@@ -23,23 +26,41 @@ class TestExtract(unittest.TestCase):
         """
         self.empty_html = "<div></div>"
 
-    @patch('requests.get')
+    @patch('utils.extract._session.get')
     def test_get_page_content_success(self, mock_get):
         mock_response = Mock()
-        mock_response.text = self.sample_html
+        mock_response.content = self.sample_html.encode("utf-8")
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         result = get_page_content("https://fashion-studio.dicoding.dev/")
-        self.assertEqual(result, self.sample_html)
+        self.assertEqual(result, self.sample_html.encode("utf-8"))
 
-    @patch('requests.get')
+    @patch('utils.extract._session.get')
     def test_get_page_content_request_exception(self, mock_get):
         mock_get.side_effect = RequestException("Request failed")  # gunakan RequestException
         result = get_page_content("http://test.com")
         self.assertIsNone(result)
 
 
+    @patch('utils.extract._session.get')
+    def test_get_page_content_cache(self, mock_get):
+        mock_response = Mock()
+        mock_response.content = self.sample_html.encode("utf-8")
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        with patch('utils.extract.PAGE_CACHE_DIR', cache_dir), \
+                patch.dict(os.environ, {"ETL_PAGE_CACHE_TTL": "3600"}):
+            first = get_page_content("https://fashion-studio.dicoding.dev/page2")
+            second = get_page_content("https://fashion-studio.dicoding.dev/page2")
+
+        self.assertEqual(first, self.sample_html.encode("utf-8"))
+        self.assertEqual(second, first)
+        mock_get.assert_called_once()
+
     def test_parse_product_card_valid(self):
         soup = BeautifulSoup(self.sample_html, "html.parser")
         card = soup.find("div", class_="product-card")
@@ -57,6 +78,12 @@ class TestExtract(unittest.TestCase):
                         {k: v for k, v in expected.items() if k != "timestamp"})
         self.assertTrue(isinstance(result["timestamp"], str))
 
+    def test_parse_product_card_with_timestamp(self):
+        soup = BeautifulSoup(self.sample_html, "html.parser")
+        card = soup.find("div", class_="product-card")
+        result = parse_product_card(card, "2023-10-01T00:00:00")
+        self.assertEqual(result["timestamp"], "2023-10-01T00:00:00")
+
     def test_parse_product_card_no_title(self):
         invalid_html = """
         <div class="product-card">
@@ -105,18 +132,16 @@ class TestExtract(unittest.TestCase):
             "gender": "Unisex",
             "timestamp": "2023-10-01T00:00:00"
         }):
-            with patch('utils.extract.time.sleep', return_value=None):
-                df = extract_data()
-                self.assertFalse(df.empty)
-                self.assertEqual(len(df), 1)
-                self.assertEqual(df.iloc[0]["title"], "Test Product")
+            df = extract_data()
+            self.assertFalse(df.empty)
+            self.assertEqual(len(df), 1)
+            self.assertEqual(df.iloc[0]["title"], "Test Product")
 
     @patch('utils.extract.get_page_content')
     def test_extract_data_no_content(self, mock_get_page):
         mock_get_page.return_value = None
-        with patch('utils.extract.time.sleep', return_value=None):
-            df = extract_data()
-            self.assertTrue(df.empty)
+        df = extract_data()
+        self.assertTrue(df.empty)
 
     @patch('utils.extract.get_page_content')
     @patch('utils.extract.BeautifulSoup')
@@ -125,9 +150,51 @@ class TestExtract(unittest.TestCase):
         mock_soup_instance = Mock()
         mock_soup_instance.select.return_value = []
         mock_soup.return_value = mock_soup_instance
-        with patch('utils.extract.time.sleep', return_value=None):
-            df = extract_data()
-            self.assertTrue(df.empty)
+        df = extract_data()
+        self.assertTrue(df.empty)
+
+    @patch('utils.extract.TOTAL_PAGES', 3)
+    @patch('utils.extract.get_page_content')
+    def test_extract_pages_yields_per_page(self, mock_get_page):
+        # Fetched pages arrive as raw bytes, str input is still accepted
+        mock_get_page.side_effect = [self.sample_html.encode("utf-8"), None, self.sample_html]
+        pages = list(extract_pages())
+        self.assertEqual(len(pages), 2)
+        for page_df in pages:
+            self.assertEqual(len(page_df), 1)
+            self.assertEqual(page_df.iloc[0]["title"], "Test Product")
+
+    @patch('utils.extract.TOTAL_PAGES', 3)
+    @patch('utils.extract.get_page_content')
+    def test_extract_pages_parse_workers(self, mock_get_page):
+        mock_get_page.side_effect = [self.sample_html, None, self.sample_html]
+        pages = list(extract_pages(parse_workers=2))
+        self.assertEqual(len(pages), 2)
+        for page_df in pages:
+            self.assertEqual(page_df.iloc[0]["title"], "Test Product")
+            self.assertEqual(page_df.iloc[0]["size"], "M")
+
+    @patch('utils.extract.TOTAL_PAGES', 20)
+    @patch('utils.extract.MAX_WORKERS', 4)
+    @patch('utils.extract.get_page_content')
+    def test_extract_pages_stops_after_empty_streak(self, mock_get_page):
+        mock_get_page.side_effect = lambda url: self.sample_html if url.endswith(("dev", "page2")) else self.empty_html
+        pages = list(extract_pages())
+        self.assertEqual(len(pages), 2)
+        # Stops after 4 empty pages in a row (pages 3-6), with at most 4 more requests in flight
+        self.assertLessEqual(mock_get_page.call_count, 10)
+
+    @patch('utils.extract.TOTAL_PAGES', 20)
+    @patch('utils.extract.MAX_WORKERS', 4)
+    @patch('utils.extract.get_page_content')
+    def test_extract_pages_skips_failed_fetches(self, mock_get_page):
+        # A burst of failed requests must not be mistaken for the end of the catalogue
+        failing = {page_url(page) for page in range(4, 12)}
+        mock_get_page.side_effect = lambda url: None if url in failing else self.sample_html
+        with self.assertLogs('utils.extract', level='WARNING') as logs:
+            pages = list(extract_pages())
+        self.assertEqual(len(pages), 12)
+        self.assertIn("Failed to fetch 8 pages", "\n".join(logs.output))
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
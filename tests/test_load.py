@@ -1,19 +1,30 @@
 import unittest
-from unittest.mock import patch, Mock, mock_open
+from unittest.mock import patch, Mock, MagicMock, mock_open
+from types import SimpleNamespace
 import pandas as pd
+import pyarrow.parquet as pq
 import os
 import gspread
 import tempfile
+import shutil
 import logging
-from utils.load import save_to_csv, save_to_google_sheets, save_to_postgresql, load_data, LoadError
+from utils.load import (
+    save_to_csv, save_to_parquet, save_to_google_sheets, get_gspread_client,
+    save_to_postgresql, psql_insert_copy, psql_insert_values, get_engine, load_data, LoadError,
+    _gspread_clients, _spreadsheets, _engines
+)
 from gspread import WorksheetNotFound
 
 # Suppress logging during tests
 logging.getLogger().setLevel(logging.CRITICAL)
 
 class TestLoad(unittest.TestCase):
-    def setUp(self):
-        self.sample_df = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        # One temporary directory shared by all tests in the class
+        cls.temp_dir = tempfile.mkdtemp()
+        # Template frame built once; each test works on its own copy
+        cls.template_df = pd.DataFrame({
             "title": ["Test Product"],
             "price": [99.99],
             "rating": [4.5],
@@ -21,7 +32,18 @@ class TestLoad(unittest.TestCase):
             "size": ["M"],
             "gender": ["Unisex"]
         })
-        self.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        # Clean up temporary directory
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        # Every test patches its own gspread client and engine
+        _gspread_clients.clear()
+        _spreadsheets.clear()
+        _engines.clear()
+        self.sample_df = self.template_df.copy()
         self.connection_params = {
             "host": "localhost",
             "database": "testdb",
@@ -30,10 +52,30 @@ class TestLoad(unittest.TestCase):
             "port": 5432
         }
 
-    def tearDown(self):
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def patch_gspread(self):
+        """Patch the credentials file lookup, credentials parsing and authorization together."""
+        mocks = SimpleNamespace()
+        for name, target in (
+            ("mtime", "os.path.getmtime"),
+            ("credentials", "utils.load.Credentials.from_service_account_file"),
+            ("authorize", "utils.load.gspread.authorize"),
+        ):
+            patcher = patch(target)
+            setattr(mocks, name, patcher.start())
+            self.addCleanup(patcher.stop)
+        mocks.mtime.return_value = 1700000000.0
+        return mocks
+
+    def load_state_kwargs(self):
+        """load_data arguments for a PostgreSQL-only load tracked in a fresh state file."""
+        state_path = os.path.join(self.temp_dir, "load_state.json")
+        self.addCleanup(lambda: os.path.exists(state_path) and os.remove(state_path))
+        return dict(
+            save_csv=False,
+            save_postgres=True,
+            postgres_params=self.connection_params,
+            state_path=state_path
+        )
 
     def test_save_to_csv_success(self):
         file_path = save_to_csv(self.sample_df, self.temp_dir, "test.csv")
@@ -47,58 +89,195 @@ class TestLoad(unittest.TestCase):
             save_to_csv(pd.DataFrame(), self.temp_dir, "test.csv")
 
     def test_save_to_csv_permission_error(self):
-        with patch('pandas.DataFrame.to_csv', side_effect=PermissionError("Permission denied")):
+        with patch('utils.load.pacsv.write_csv', side_effect=PermissionError("Permission denied")):
             with self.assertRaises(LoadError):
                 save_to_csv(self.sample_df, "/root/test", "test.csv")
 
+    def test_save_to_parquet_success(self):
+        file_path = save_to_parquet(self.sample_df, self.temp_dir, "test.parquet")
+        self.assertTrue(os.path.exists(file_path))
+        df_read = pd.read_parquet(file_path)
+        pd.testing.assert_frame_equal(df_read, self.sample_df)
+
+    def test_save_to_parquet_compression(self):
+        file_path = save_to_parquet(self.sample_df, self.temp_dir, "test_snappy.parquet", compression="snappy")
+        metadata = pq.ParquetFile(file_path).metadata
+        self.assertEqual(metadata.row_group(0).column(0).compression, "SNAPPY")
+
+    def test_save_to_parquet_empty_df(self):
+        with self.assertRaises(LoadError):
+            save_to_parquet(pd.DataFrame(), self.temp_dir, "test.parquet")
 
-    @patch('utils.load.gspread.authorize')
-    @patch('utils.load.Credentials.from_service_account_file')
-    @patch('os.path.exists')
-    def test_save_to_google_sheets_success(self, mock_exists, mock_credentials, mock_authorize):
-        mock_exists.return_value = True
+    @patch('utils.load.save_to_parquet')
+    def test_load_data_parquet(self, mock_parquet):
+        mock_parquet.return_value = "/path/to/test.parquet"
+        results = load_data(
+            self.sample_df,
+            save_csv=False,
+            save_parquet=True,
+            parquet_path=self.temp_dir,
+            parquet_filename="test.parquet"
+        )
+        self.assertEqual(results["parquet_path"], "/path/to/test.parquet")
+        mock_parquet.assert_called_once_with(self.sample_df, self.temp_dir, "test.parquet")
+
+    @patch('utils.load._new_sheet_id', return_value=1)
+    def test_save_to_google_sheets_success(self, mock_sheet_id):
+        mocks = self.patch_gspread()
 
         mock_spreadsheet = Mock()
         mock_spreadsheet.id = "fake_spreadsheet_id"  
-        mock_worksheet = Mock()
-        mock_spreadsheet.worksheet.side_effect = gspread.exceptions.WorksheetNotFound()
-        mock_spreadsheet.add_worksheet.return_value = mock_worksheet
+        mock_spreadsheet.worksheets.return_value = [Mock(title="Sheet1", id=0)]
         mock_spreadsheet.share.return_value = None
 
         mock_client = Mock()
         mock_client.create.return_value = mock_spreadsheet
         mock_client.open_by_key.return_value = mock_spreadsheet
-        mock_authorize.return_value = mock_client
-        mock_credentials.return_value = Mock()
+        mocks.authorize.return_value = mock_client
+        mocks.credentials.return_value = Mock()
 
-        with patch('utils.load.set_with_dataframe', return_value=None):
-            spreadsheet_id = save_to_google_sheets(
-                self.sample_df,
-                "fake_credentials.json",
-                sheet_name="TestSheet",
-                create_if_not_exists=True
-            )
-            self.assertIsInstance(spreadsheet_id, str)
+        spreadsheet_id = save_to_google_sheets(
+            self.sample_df,
+            "fake_credentials.json",
+            sheet_name="TestSheet",
+            create_if_not_exists=True
+        )
+        self.assertIsInstance(spreadsheet_id, str)
+
+        def cells(*values):
+            return {"values": [
+                {"userEnteredValue": {"numberValue" if isinstance(v, (int, float)) else "stringValue": v}}
+                for v in values
+            ]}
+
+        # Worksheet creation and the data go out in one batchUpdate
+        mock_spreadsheet.batch_update.assert_called_once_with({"requests": [
+            {"addSheet": {"properties": {
+                "sheetId": 1, "title": "TestSheet", "gridProperties": {"rowCount": 2, "columnCount": 6}
+            }}},
+            {"updateCells": {
+                "start": {"sheetId": 1, "rowIndex": 0, "columnIndex": 0},
+                "rows": [
+                    cells("title", "price", "rating", "colors", "size", "gender"),
+                    cells("Test Product", 99.99, 4.5, 3, "M", "Unisex")
+                ],
+                "fields": "userEnteredValue"
+            }}
+        ]})
+        mock_spreadsheet.share.assert_called_once_with(None, role='reader', perm_type='anyone')
+
+    def test_save_to_google_sheets_float32_values(self):
+        mocks = self.patch_gspread()
+        mock_spreadsheet = mocks.authorize.return_value.open_by_key.return_value
+        mock_spreadsheet.worksheets.return_value = []
+
+        df = self.sample_df.assign(rating=4.8).astype({"rating": "float32"})
+        df.loc[0, "size"] = None
+        save_to_google_sheets(df[["rating", "size"]], "fake_credentials.json", spreadsheet_id="fake_id")
+
+        update = mock_spreadsheet.batch_update.call_args[0][0]["requests"][1]["updateCells"]
+        self.assertEqual(update["rows"][1], {"values": [
+            {"userEnteredValue": {"numberValue": 4.8}},
+            {}
+        ]})
+
+    def test_save_to_google_sheets_batches(self):
+        mocks = self.patch_gspread()
+        mock_spreadsheet = Mock()
+        mock_spreadsheet.worksheets.return_value = [Mock(title="Products", id=7)]
+        mocks.authorize.return_value.open_by_key.return_value = mock_spreadsheet
+
+        df = pd.concat([self.sample_df] * 4, ignore_index=True)
+        save_to_google_sheets(df, "fake_credentials.json", spreadsheet_id="fake_id", batch_size=2)
+
+        batches = [c[0][0]["requests"] for c in mock_spreadsheet.batch_update.call_args_list]
+        # The existing worksheet is resized in the first batch instead of cleared
+        self.assertEqual(batches[0][0]["updateSheetProperties"]["properties"], {
+            "sheetId": 7, "gridProperties": {"rowCount": 5, "columnCount": 6}
+        })
+        mock_spreadsheet.share.assert_not_called()
+        updates = [r["updateCells"] for batch in batches for r in batch if "updateCells" in r]
+        self.assertEqual([u["start"]["rowIndex"] for u in updates], [0, 2, 4])
+        self.assertEqual(sum(len(u["rows"]) for u in updates), 5)  # header + 4 rows
+
+    def test_save_to_google_sheets_invalid_batch_size(self):
+        mocks = self.patch_gspread()
+        with self.assertRaises(LoadError):
+            save_to_google_sheets(self.sample_df, "fake_credentials.json",
+                                  spreadsheet_id="fake_id", batch_size=-1)
+        mocks.authorize.return_value.open_by_key.assert_not_called()
 
+    def test_save_to_google_sheets_parallel_new_worksheets(self):
+        mocks = self.patch_gspread()
+        mock_spreadsheet = mocks.authorize.return_value.open_by_key.return_value
+        # Both uploads see the same worksheet list, as parallel backfill runs do
+        mock_spreadsheet.worksheets.return_value = [Mock(title="Sheet1", id=0)]
+
+        save_to_google_sheets(self.sample_df, "fake_credentials.json", spreadsheet_id="fake_id",
+                              sheet_name="Products_20240101")
+        save_to_google_sheets(self.sample_df, "fake_credentials.json", spreadsheet_id="fake_id",
+                              sheet_name="Products_20240102")
+
+        sheet_ids = [c[0][0]["requests"][0]["addSheet"]["properties"]["sheetId"]
+                     for c in mock_spreadsheet.batch_update.call_args_list]
+        self.assertEqual(len(sheet_ids), 2)
+        self.assertNotEqual(sheet_ids[0], sheet_ids[1])
+
+    @patch('utils.load._new_sheet_id', side_effect=[5, 6])
+    def test_save_to_google_sheets_retries_taken_sheet_id(self, mock_sheet_id):
+        mocks = self.patch_gspread()
+        mock_spreadsheet = mocks.authorize.return_value.open_by_key.return_value
+        mock_spreadsheet.worksheets.return_value = []
+        response = Mock()
+        response.json.return_value = {"error": {
+            "code": 400, "message": "A sheet with the id 5 already exists", "status": "INVALID_ARGUMENT"
+        }}
+        mock_spreadsheet.batch_update.side_effect = [gspread.exceptions.APIError(response), None]
+
+        save_to_google_sheets(self.sample_df, "fake_credentials.json", spreadsheet_id="fake_id")
+
+        retry = mock_spreadsheet.batch_update.call_args[0][0]["requests"]
+        self.assertEqual(retry[0]["addSheet"]["properties"]["sheetId"], 6)
+        self.assertEqual(retry[1]["updateCells"]["start"]["sheetId"], 6)
+
+    def test_get_gspread_client_is_reused(self):
+        mocks = self.patch_gspread()
+        first = get_gspread_client("fake_credentials.json")
+        second = get_gspread_client("fake_credentials.json")
+        self.assertIs(first, second)
+        mocks.credentials.assert_called_once()
+        mocks.authorize.assert_called_once()
+
+    def test_get_gspread_client_reloads_rotated_credentials(self):
+        mocks = self.patch_gspread()
+        get_gspread_client("fake_credentials.json")
+        mocks.mtime.return_value += 60
+        get_gspread_client("fake_credentials.json")
+        self.assertEqual(mocks.credentials.call_count, 2)
+        self.assertEqual(mocks.authorize.call_count, 2)
+
+    def test_save_to_google_sheets_reuses_spreadsheet(self):
+        mocks = self.patch_gspread()
+        mocks.authorize.return_value.open_by_key.return_value.worksheets.return_value = []
+        save_to_google_sheets(self.sample_df, "fake_credentials.json", spreadsheet_id="fake_id")
+        save_to_google_sheets(self.sample_df, "fake_credentials.json", spreadsheet_id="fake_id")
+        mocks.authorize.return_value.open_by_key.assert_called_once_with("fake_id")
 
     def test_save_to_google_sheets_empty_df(self):
         with self.assertRaises(LoadError):
             save_to_google_sheets(pd.DataFrame(), "fake_credentials.json")
 
-    @patch('os.path.exists')
-    def test_save_to_google_sheets_no_credentials(self, mock_exists):
-        mock_exists.return_value = False
+    @patch('os.path.getmtime')
+    def test_save_to_google_sheets_no_credentials(self, mock_mtime):
+        mock_mtime.side_effect = FileNotFoundError("nonexistent.json")
         with self.assertRaises(LoadError):
             save_to_google_sheets(self.sample_df, "nonexistent.json")
 
     # Test for handling Google API errors
-    @patch('utils.load.gspread.authorize')
-    @patch('utils.load.Credentials.from_service_account_file')
-    @patch('os.path.exists')
-    def test_save_to_google_sheets_api_error(self, mock_exists, mock_credentials, mock_authorize):
-        mock_exists.return_value = True
+    def test_save_to_google_sheets_api_error(self):
+        mocks = self.patch_gspread()
         mock_client = Mock()
-        mock_authorize.return_value = mock_client
+        mocks.authorize.return_value = mock_client
         mock_client.create.side_effect = Exception("API Error")
         
         with self.assertRaises(LoadError):
@@ -107,7 +286,7 @@ class TestLoad(unittest.TestCase):
     @patch('utils.load.create_engine')
     def test_save_to_postgresql_success(self, mock_engine):
         mock_conn = Mock()
-        mock_engine.return_value.connect.return_value.__enter__.return_value = mock_conn
+        mock_engine.return_value.begin.return_value.__enter__.return_value = mock_conn
         mock_conn.execute.return_value = None
         with patch('pandas.DataFrame.to_sql', return_value=None):
             result = save_to_postgresql(
@@ -119,6 +298,59 @@ class TestLoad(unittest.TestCase):
             )
             self.assertTrue(result)
 
+    @patch('utils.load.create_engine')
+    def test_save_to_postgresql_uses_copy(self, mock_engine):
+        with patch('pandas.DataFrame.to_sql', return_value=None) as mock_to_sql:
+            save_to_postgresql(self.sample_df, "products", self.connection_params, batch_size=500)
+        _, kwargs = mock_to_sql.call_args
+        self.assertIs(kwargs["method"], psql_insert_copy)
+        self.assertEqual(kwargs["chunksize"], 500)
+        # The load runs on the connection opened for the whole transaction
+        self.assertIs(kwargs["con"], mock_engine.return_value.begin.return_value.__enter__.return_value)
+
+    @patch('utils.load.create_engine')
+    def test_get_engine_is_reused(self, mock_engine):
+        first = get_engine(self.connection_params)
+        second = get_engine(dict(self.connection_params))
+        self.assertIs(first, second)
+        mock_engine.assert_called_once()
+        url = mock_engine.call_args[0][0]
+        self.assertEqual(url.drivername, "postgresql+psycopg2")
+        self.assertEqual(url.database, "testdb")
+        self.assertTrue(mock_engine.call_args.kwargs["pool_pre_ping"])
+
+    def test_psql_insert_copy(self):
+        table = SimpleNamespace(schema="public", name="products")
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.connection.cursor.return_value.__enter__.return_value
+
+        psql_insert_copy(table, mock_conn, ["title", "price"], iter([("Test Product", 99.99), ("Other", None)]))
+
+        sql, buffer = mock_cursor.copy_expert.call_args[0]
+        self.assertEqual(sql, 'COPY "public"."products" ("title", "price") FROM STDIN WITH CSV')
+        self.assertEqual(buffer.getvalue(), "Test Product,99.99\nOther,\n")
+
+    @patch('utils.load.create_engine')
+    def test_save_to_postgresql_without_copy(self, mock_engine):
+        with patch('pandas.DataFrame.to_sql', return_value=None) as mock_to_sql:
+            save_to_postgresql(self.sample_df, "products", self.connection_params, use_copy=False)
+        self.assertIs(mock_to_sql.call_args.kwargs["method"], psql_insert_values)
+
+    @patch('utils.load.execute_values')
+    def test_psql_insert_values(self, mock_execute_values):
+        table = SimpleNamespace(schema="public", name="products")
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.connection.cursor.return_value.__enter__.return_value
+
+        psql_insert_values(table, mock_conn, ["title", "price"], iter([("Test Product", 99.99)]))
+
+        mock_execute_values.assert_called_once_with(
+            mock_cursor,
+            'INSERT INTO "public"."products" ("title", "price") VALUES %s',
+            [("Test Product", 99.99)],
+            page_size=1000
+        )
+
     def test_save_to_postgresql_empty_df(self):
         with self.assertRaises(LoadError):
             save_to_postgresql(pd.DataFrame(), "products", self.connection_params)
@@ -139,15 +371,12 @@ class TestLoad(unittest.TestCase):
                 self.connection_params
             )
     
-    @patch('utils.load.gspread.authorize')
-    @patch('utils.load.Credentials.from_service_account_file')
-    @patch('os.path.exists')
-    def test_save_to_google_sheets_spreadsheet_not_found_without_create(self, mock_exists, mock_credentials, mock_authorize):
-        mock_exists.return_value = True
+    def test_save_to_google_sheets_spreadsheet_not_found_without_create(self):
+        mocks = self.patch_gspread()
         mock_client = Mock()
         mock_client.open_by_key.side_effect = gspread.exceptions.SpreadsheetNotFound()
-        mock_authorize.return_value = mock_client
-        mock_credentials.return_value = Mock()
+        mocks.authorize.return_value = mock_client
+        mocks.credentials.return_value = Mock()
 
         with self.assertRaises(LoadError) as ctx:
             save_to_google_sheets(
@@ -188,7 +417,7 @@ class TestLoad(unittest.TestCase):
     @patch('utils.load.create_engine')
     def test_save_to_postgresql_sql_error(self, mock_engine):
         mock_conn = Mock()
-        mock_engine.return_value.connect.return_value.__enter__.return_value = mock_conn
+        mock_engine.return_value.begin.return_value.__enter__.return_value = mock_conn
         
         with patch('pandas.DataFrame.to_sql', side_effect=Exception("SQL Error")):
             with self.assertRaises(LoadError):
@@ -222,6 +451,50 @@ class TestLoad(unittest.TestCase):
         self.assertEqual(results["csv_path"], "/path/to/test.csv")
         self.assertEqual(results["sheets_id"], "spreadsheet_id")
         self.assertTrue(results["postgres_success"])
+        mock_sheets.assert_called_once_with(self.sample_df, "fake_credentials.json", None, "TestSheet")
+
+    @patch('utils.load.save_to_postgresql')
+    def test_load_data_skips_unchanged_destinations(self, mock_postgres):
+        mock_postgres.return_value = True
+        kwargs = self.load_state_kwargs()
+
+        load_data(self.sample_df, **kwargs)
+        results = load_data(self.sample_df, **kwargs)
+        self.assertEqual(mock_postgres.call_count, 1)
+        self.assertTrue(results["postgres_success"])
+        self.assertEqual(results["skipped"], ["PostgreSQL"])
+
+        load_data(self.sample_df, force=True, **kwargs)
+        load_data(self.sample_df.assign(price=1.0), **kwargs)
+        self.assertEqual(mock_postgres.call_count, 3)
+
+    @patch('utils.load.save_to_postgresql')
+    def test_load_data_reloads_after_failure(self, mock_postgres):
+        kwargs = self.load_state_kwargs()
+
+        mock_postgres.return_value = True
+        load_data(self.sample_df, **kwargs)
+        mock_postgres.side_effect = LoadError("PostgreSQL error")
+        load_data(self.sample_df, force=True, **kwargs)
+        mock_postgres.side_effect = None
+        results = load_data(self.sample_df, **kwargs)
+        self.assertEqual(mock_postgres.call_count, 3)
+        self.assertNotIn("skipped", results)
+
+    @patch('utils.load.save_to_postgresql')
+    def test_load_data_ignores_timestamp_and_bad_state(self, mock_postgres):
+        mock_postgres.return_value = True
+        kwargs = self.load_state_kwargs()
+
+        load_data(self.sample_df.assign(timestamp="2023-10-01"), **kwargs)
+        results = load_data(self.sample_df.assign(timestamp="2023-10-02"), **kwargs)
+        self.assertEqual(results["skipped"], ["PostgreSQL"])
+
+        with open(kwargs["state_path"], "w", encoding="utf-8") as f:
+            f.write('{"postgres:localhost:5432/testdb/products": "not an entry"}')
+        results = load_data(self.sample_df, **kwargs)
+        self.assertEqual(mock_postgres.call_count, 2)
+        self.assertNotIn("skipped", results)
 
     def test_load_data_no_destination(self):
         with self.assertRaises(ValueError):
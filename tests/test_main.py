@@ -0,0 +1,127 @@
+import unittest
+from unittest.mock import patch
+import threading
+import argparse
+import time
+import io
+import os
+import tempfile
+from contextlib import redirect_stderr
+import pandas as pd
+import logging
+import main
+
+# Suppress logging during tests
+logging.getLogger().setLevel(logging.CRITICAL)
+
+class TestMain(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.page_df = pd.DataFrame({
+            "title": ["Test Product"],
+            "price": ["$99.99"],
+            "rating": ["4.5 / 5"],
+            "colors": ["3 Colors"],
+            "size": ["Size: M"],
+            "gender": ["Gender: Unisex"],
+            "timestamp": ["2023-10-01"]
+        })
+
+    def run_with_timeout(self, func, timeout=5):
+        """Run func in a daemon thread and return (finished, result or exception)."""
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = func()
+            except Exception as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        return not thread.is_alive(), outcome
+
+    @patch('main.extract_pages')
+    def test_extract_and_transform(self, mock_extract_pages):
+        mock_extract_pages.return_value = (self.page_df for _ in range(2))
+        extracted_count, df = main.extract_and_transform()
+        self.assertEqual(extracted_count, 2)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df.iloc[0]["size"], "M")
+
+    @patch('main.transform_data', side_effect=RuntimeError("transform failed"))
+    @patch('main.extract_pages')
+    def test_extract_and_transform_consumer_failure(self, mock_extract_pages, mock_transform):
+        # More pages than the queue holds, so the producer would block on a full queue
+        mock_extract_pages.return_value = (self.page_df for _ in range(20))
+        finished, outcome = self.run_with_timeout(lambda: main.extract_and_transform(max_queued_pages=2))
+        self.assertTrue(finished, "extract_and_transform hung after the consumer failed")
+        self.assertIsInstance(outcome.get("error"), RuntimeError)
+
+    def test_parse_args_default_destinations(self):
+        with tempfile.NamedTemporaryFile(suffix=".json") as creds:
+            args = main.parse_args(['--sheets-creds', creds.name])
+        self.assertTrue(args.csv)
+        self.assertTrue(args.sheets)
+        self.assertTrue(args.postgres)
+        self.assertFalse(args.parquet)
+
+    def test_parse_args_default_sheets_missing_creds(self):
+        missing = os.path.join(tempfile.gettempdir(), "missing-sheets-api.json")
+        args = main.parse_args(['--sheets-creds', missing])
+        self.assertFalse(args.sheets)
+        self.assertTrue(args.csv)
+        self.assertTrue(args.postgres)
+
+    def test_parse_args_explicit_sheets_missing_creds(self):
+        missing = os.path.join(tempfile.gettempdir(), "missing-sheets-api.json")
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            main.parse_args(['--sheets', '--sheets-creds', missing])
+        self.assertEqual(cm.exception.code, 2)
+
+    def test_parse_args_postgres_missing_credentials(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            main.parse_args(['--postgres', '--pg-pass', ''])
+        self.assertEqual(cm.exception.code, 2)
+
+    def test_parse_args_dates_requires_use_cache(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            main.parse_args(['--csv', '--dates', '2024-01-01:2024-01-02'])
+        self.assertEqual(cm.exception.code, 2)
+
+    @patch('main.extract_and_transform')
+    def test_run_one_backfill_cache_miss(self, mock_extract_and_transform):
+        with tempfile.TemporaryDirectory() as cache_dir, patch('main.CACHE_DIR', cache_dir), \
+                patch('main.setup_logging'):
+            args = main.parse_args(['--csv', '--use-cache', '--dates', '2024-01-01:2024-01-01'])
+            self.assertFalse(main.run_one('2024-01-01', args))
+        mock_extract_and_transform.assert_not_called()
+
+    def test_parse_date_range(self):
+        self.assertEqual(main.parse_date_range("2024-02-28:2024-03-01"),
+                         ["2024-02-28", "2024-02-29", "2024-03-01"])
+        self.assertEqual(main.parse_date_range("2024-01-01"), ["2024-01-01"])
+
+    def test_parse_date_range_invalid(self):
+        for value in ["2024-01-02:2024-01-01", "2024-13-01", "yesterday", "2024-01-01:tomorrow"]:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                main.parse_date_range(value)
+
+    def test_read_cached_transform(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_file = os.path.join(cache_dir, "transformed_20240101.parquet")
+            self.assertIsNone(main.read_cached_transform(cache_file, 24))
+
+            main.write_transform_cache(main.transform_data(self.page_df), cache_file)
+            cached = main.read_cached_transform(cache_file, 24)
+            self.assertEqual(len(cached), 1)
+            self.assertEqual(cached.iloc[0]["title"], "Test Product")
+
+            two_days_ago = time.time() - 48 * 3600
+            os.utime(cache_file, (two_days_ago, two_days_ago))
+            self.assertIsNone(main.read_cached_transform(cache_file, 24))
+            self.assertIsNotNone(main.read_cached_transform(cache_file, None))
+
+if __name__ == '__main__':
+    unittest.main()
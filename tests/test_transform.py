@@ -3,7 +3,8 @@ import pandas as pd
 import numpy as np
 from utils.transform import (
     clean_price, clean_rating, clean_colors, clean_size, clean_gender,
-    remove_dirty_data, transform_data
+    vectorized_price, vectorized_rating, vectorized_colors, vectorized_size, vectorized_gender,
+    remove_dirty_data, transform_data, combine_chunks
 )
 import logging
 
@@ -11,8 +12,10 @@ import logging
 logging.getLogger().setLevel(logging.CRITICAL)
 
 class TestTransform(unittest.TestCase):
-    def setUp(self):
-        self.sample_df = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        # Shared read-only input, the functions under test copy before modifying
+        cls.sample_df = pd.DataFrame({
             "title": ["Test Product", "Unknown Product", "Valid Product"],
             "price": ["$99.99", "N/A", "100,50"],
             "rating": ["4.5 / 5", "N/A", "3.2 out of 5"],
@@ -71,8 +74,53 @@ class TestTransform(unittest.TestCase):
         self.assertIsNone(clean_gender(None))
         self.assertIsNone(clean_gender(123))  # Non-string input
 
+    def test_vectorized_cleaners_match_scalar(self):
+        prices = pd.Series(["$99.99", "100,50", "1,000.50", "N/A", "", None, "Invalid"])
+        ratings = pd.Series(["4.5 / 5", "3.2 out of 5", "тнР4.5", "N/A", "", None])
+        colors = pd.Series(["3 Colors", "2 Colors Available", "Unknown Colors", "", None])
+
+        for vectorized, scalar, values in [
+            (vectorized_price, clean_price, prices),
+            (vectorized_rating, clean_rating, ratings),
+            (vectorized_colors, clean_colors, colors),
+        ]:
+            expected = [np.nan if v is None else v for v in values.map(scalar)]
+            np.testing.assert_array_equal(vectorized(values).to_numpy(), np.array(expected, dtype=float))
+
+    def test_vectorized_prefix_cleaners_match_scalar(self):
+        sizes = pd.Series(["Size: M", "size:L", "Large", "Size: ", "", None, 123])
+        genders = pd.Series(["Gender: Unisex", "GENDER: Male", "Women", "", None, 1.5])
+
+        for vectorized, scalar, values in [
+            (vectorized_size, clean_size, sizes),
+            (vectorized_gender, clean_gender, genders),
+        ]:
+            expected = [scalar(v) for v in values]
+            result = [None if pd.isna(v) else v for v in vectorized(values)]
+            self.assertEqual(result, expected)
+
+    def test_transform_data_dtypes(self):
+        df = transform_data(self.sample_df)
+        self.assertEqual(df["price"].dtype, np.float32)
+        self.assertEqual(df["rating"].dtype, np.float32)
+        self.assertEqual(df["colors"].dtype, np.int16)
+        self.assertIsInstance(df["size"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["gender"].dtype, pd.CategoricalDtype)
+
+    def test_combine_chunks_keeps_categories(self):
+        first = transform_data(self.sample_df.iloc[[0]])
+        second = transform_data(self.sample_df)
+        combined = combine_chunks([first, second])
+        self.assertEqual(len(combined), len(first) + len(second))
+        self.assertIsInstance(combined["size"].dtype, pd.CategoricalDtype)
+        self.assertTrue(combine_chunks([]).empty)
+
     def test_remove_dirty_data(self):
+        original = self.sample_df.copy()
         df = remove_dirty_data(self.sample_df)
+        pd.testing.assert_frame_equal(self.sample_df, original)
+        # Returned as an independent frame, not a view-flagged slice of the input
+        self.assertIsNone(df._is_copy)
         self.assertEqual(len(df), 2)  # "Test Product" dan "Valid Product" harusnya lolos
         self.assertIn("Test Product", df["title"].values)
         self.assertIn("Valid Product", df["title"].values)
@@ -92,7 +140,7 @@ class TestTransform(unittest.TestCase):
         # Validasi baris Valid Product
         valid_row = df[df["title"] == "Valid Product"].iloc[0]
         self.assertEqual(valid_row["price"], 100.50 * 16000)
-        self.assertEqual(valid_row["rating"], 3.2)
+        self.assertAlmostEqual(valid_row["rating"], 3.2, places=5)
         self.assertEqual(valid_row["colors"], 2)
         self.assertEqual(valid_row["size"], "L")
         self.assertEqual(valid_row["gender"], "Male")
@@ -3,12 +3,23 @@ Extract module for ETL pipeline.
 Provides functionality to extract data from fashion studio website.
 """
 
+import os
+import hashlib
+import functools
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import zstandard
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import pandas as pd
 from datetime import datetime
 import time
+import re
 import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Setup logging
 logging.basicConfig(
@@ -19,21 +30,116 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://fashion-studio.dicoding.dev"
 TOTAL_PAGES = 50
+MAX_WORKERS = 8  # Number of pages fetched concurrently
 
+# Shared HTTP session so page fetches reuse keep-alive connections to the site
+_session = requests.Session()
+_session.headers.update({"User-Agent": "Simple-ETL-Pipeline/1.0"})
+_session.mount(BASE_URL, HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_WORKERS,
+    # 429 is retried too, waiting as long as the server's Retry-After asks
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+))
 
+# On-disk cache of fetched pages, enabled by setting ETL_PAGE_CACHE_TTL (seconds)
+PAGE_CACHE_DIR = os.path.join(".cache", "pages")
+PAGE_CACHE_TTL_ENV = "ETL_PAGE_CACHE_TTL"
+
+# Columns of the extracted product records, in output order
+PRODUCT_COLUMNS = ["title", "price", "rating", "colors", "size", "gender", "timestamp"]
+
+# Only build the parts of the page that can hold product cards
+PRODUCT_CARD_STRAINER = SoupStrainer("div", class_=re.compile(r"product|collection|item"))
+
+# CSS selectors compiled once instead of on every select call
+CARD_SELECTOR = sv.compile("div.collection-card, div.product-card, div.item-card")
+FALLBACK_CARD_SELECTOR = sv.compile(
+    "div[class*='product'], div[class*='collection'], div[class*='item']")
+TITLE_SELECTOR = sv.compile("h3.product-title")
+PRICE_SELECTOR = sv.compile("span.price")
+DETAIL_SELECTOR = sv.compile("p")
+
+# "Label: value" detail lines, matched in one pass instead of per-label checks
+DETAIL_PATTERN = re.compile(r"(Rating|Size|Gender):\s*(.*)")
+
+
+def cache_page_content(fetch):
+    """
+    Cache raw page bytes on disk as zstd-compressed HTML keyed by URL.
+
+    The cache is disabled unless the ETL_PAGE_CACHE_TTL environment variable
+    holds a positive lifetime in seconds, so reruns during development can
+    skip the network entirely.
+    """
+    @functools.wraps(fetch)
+    def wrapper(url):
+        try:
+            ttl = float(os.environ.get(PAGE_CACHE_TTL_ENV, 0))
+        except ValueError:
+            logger.warning(f"Invalid {PAGE_CACHE_TTL_ENV} value, page cache disabled")
+            ttl = 0
+        if ttl <= 0:
+            return fetch(url)
+
+        url_hash = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        cache_file = os.path.join(PAGE_CACHE_DIR, f"{url_hash}.html.zst")
+        try:
+            if time.time() - os.path.getmtime(cache_file) < ttl:
+                with open(cache_file, "rb") as f:
+                    content = zstandard.ZstdDecompressor().decompress(f.read())
+                logger.info(f"Using cached page for {url}")
+                return content
+        except FileNotFoundError:
+            pass
+        except (OSError, zstandard.ZstdError) as e:
+            logger.warning(f"Failed to read cached page for {url}: {e}")
+
+        content = fetch(url)
+        if content is not None:
+            try:
+                os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+                # Write to a temporary file first so concurrent readers never see a partial file
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                with open(tmp_file, "wb") as f:
+                    f.write(zstandard.ZstdCompressor().compress(content))
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.warning(f"Failed to cache page for {url}: {e}")
+        return content
+
+    return wrapper
+
+
+@cache_page_content
 def get_page_content(url):
-    """Get content from URL with error handling."""
+    """
+    Get content from URL with error handling.
+
+    Returns the raw response bytes, lxml detects the document encoding
+    itself so the body is never decoded into a str first.
+    """
     try:
-        response = requests.get(url, timeout=10)
+        response = _session.get(url, timeout=10)
         response.raise_for_status()
-        return response.text
+        return response.content
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to fetch page {url}: {e}")
         return None
 
 
-def parse_product_card(card):
-    """Parse a product card from the HTML and extract details."""
+def parse_product_card(card, timestamp=None):
+    """
+    Parse a product card from the HTML and extract details.
+
+    The timestamp is the extraction time stored with the product, it
+    defaults to the current time.
+    """
     try:
         # Make sure card exists
         if not card:
@@ -41,96 +147,196 @@ def parse_product_card(card):
             return None
 
         # Find title with better error handling
-        title_elem = card.find("h3", class_="product-title")
+        title_elem = card.select_one(TITLE_SELECTOR)
         if not title_elem:
             logger.warning("No title found in product card")
             return None
-        title = title_elem.text.strip()
+        title = title_elem.get_text(strip=True)
 
         # Find price with error handling
-        price_elem = card.find("span", class_="price")
+        price_elem = card.select_one(PRICE_SELECTOR)
         if not price_elem:
             logger.warning(f"No price found for product: {title}")
             price = "N/A"
         else:
-            price = price_elem.text.strip()
+            price = price_elem.get_text(strip=True)
 
         # Extract details with safer approach
-        details = card.find_all("p")
-        rating = "N/A"
+        details = card.select(DETAIL_SELECTOR)
+        fields = {"Rating": "N/A", "Size": "N/A", "Gender": "N/A"}
         colors = "N/A"
-        size = "N/A"
-        gender = "N/A"
 
         for detail in details:
-            text = detail.text.strip()
-            if "Rating:" in text:
-                rating = text.replace("Rating:", "").strip()
-            elif 'Colors' in text:
+            text = detail.get_text(strip=True)
+            match = DETAIL_PATTERN.match(text)
+            if match:
+                fields[match.group(1)] = match.group(2)
+            elif "Colors" in text:
                 colors = text
-            elif "Size:" in text:
-                size = text.replace("Size:", "").strip()
-            elif "Gender:" in text:
-                gender = text.replace("Gender:", "").strip()
 
         return {
             "title": title,
             "price": price,
-            "rating": rating,
+            "rating": fields["Rating"],
             "colors": colors,
-            "size": size,
-            "gender": gender,
-            "timestamp": datetime.now().isoformat()
+            "size": fields["Size"],
+            "gender": fields["Gender"],
+            "timestamp": timestamp or datetime.now().isoformat()
         }
     except Exception as e:
         logger.error(f"Failed to parse product card: {e}")
         return None
 
 
-def extract_data():
+def page_url(page):
+    """Build the URL of a catalogue page."""
+    return f"{BASE_URL}/page{page}" if page > 1 else BASE_URL
+
+
+def fetch_page(url):
+    """Fetch a page, logging the request."""
+    logger.info(f"Fetching data from {url}")
+    return get_page_content(url)
+
+
+def parse_page(html_content, page, timestamp=None):
     """
-    Main extraction function that scrapes product data from the website.
+    Parse all product cards from the HTML of a single page.
 
     Returns:
-        pd.DataFrame: DataFrame containing product information
+        dict: One list of values per column in PRODUCT_COLUMNS
     """
-    all_products = []
+    page_columns = {column: [] for column in PRODUCT_COLUMNS}
+    try:
+        soup = BeautifulSoup(html_content, "lxml", parse_only=PRODUCT_CARD_STRAINER)
+        # Try different selectors if the original doesn't work
+        product_cards = soup.select(CARD_SELECTOR)
 
-    for page in range(1, TOTAL_PAGES + 1):
-        url = f"{BASE_URL}/page{page}" if page > 1 else BASE_URL
-        logger.info(f"Fetching data from {url}")
+        if not product_cards:
+            logger.warning(
+                f"No product cards found on page {page}. Trying alternative selectors.")
+            # Try more general approach
+            product_cards = soup.select(FALLBACK_CARD_SELECTOR)
 
-        html_content = get_page_content(url)
-        if html_content is None:
-            continue
+        logger.info(f"Found {len(product_cards)} products on page {page}")
 
-        try:
-            soup = BeautifulSoup(html_content, "html.parser")
-            # Try different selectors if the original doesn't work
-            product_cards = soup.select(
-                "div.collection-card, div.product-card, div.item-card")
-
-            if not product_cards:
-                logger.warning(
-                    f"No product cards found on page {page}. Trying alternative selectors.")
-                # Try more general approach
-                product_cards = soup.select(
-                    "div[class*='product'], div[class*='collection'], div[class*='item']")
-
-            logger.info(f"Found {len(product_cards)} products on page {page}")
-
-            for card in product_cards:
-                product_data = parse_product_card(card)
-                if product_data:
-                    all_products.append(product_data)
-        except Exception as e:
-            logger.error(f"Failed to process page {page}: {e}")
-
-        # Be nice to the server
-        time.sleep(1.5)  # slightly longer delay to be more polite
-
-    # Create DataFrame from collected products
-    df = pd.DataFrame(all_products)
+        for card in product_cards:
+            product_data = parse_product_card(card, timestamp)
+            if product_data:
+                for column in PRODUCT_COLUMNS:
+                    page_columns[column].append(product_data[column])
+    except Exception as e:
+        logger.error(f"Failed to process page {page}: {e}")
+
+    return page_columns
+
+
+def fetch_and_parse(page, parse_pool, timestamp=None):
+    """
+    Fetch a page and parse it in a worker process of parse_pool.
+
+    Runs in a fetch thread, which waits for the parsed columns so parsing of
+    the page overlaps with the fetches of the pages after it.
+    """
+    html_content = fetch_page(page_url(page))
+    if html_content is None:
+        return None
+    return parse_pool.submit(parse_page, html_content, page, timestamp).result()
+
+
+def extract_pages(parse_workers=0):
+    """
+    Scrape product data from the website one page at a time.
+
+    Up to MAX_WORKERS page requests are kept in flight, which also bounds the
+    load put on the server. Pages are parsed in page order while the next
+    pages are still being fetched. Scraping stops early once MAX_WORKERS
+    consecutive pages are fetched and parsed without any product cards.
+    Pages that fail to fetch do not count toward that streak, they are
+    skipped and reported once extraction finishes.
+
+    Args:
+        parse_workers: Number of processes that parse pages in parallel. With
+            the default of 0 pages are parsed in the calling thread.
+
+    Yields:
+        pd.DataFrame: DataFrame containing the products found on a single page
+    """
+    pages = iter(range(1, TOTAL_PAGES + 1))
+    in_flight = deque()
+    empty_streak = 0
+    failed_pages = []
+    # One extraction time for the whole run instead of a clock read per card
+    timestamp = datetime.now().isoformat()
+    # Fetch threads are already running when workers start, so spawn rather than fork
+    parse_pool = ProcessPoolExecutor(
+        max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn")
+    ) if parse_workers else None
+
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            def submit_next():
+                page = next(pages, None)
+                if page is None:
+                    return
+                if parse_pool is None:
+                    future = executor.submit(fetch_page, page_url(page))
+                else:
+                    future = executor.submit(fetch_and_parse, page, parse_pool, timestamp)
+                in_flight.append((page, future))
+
+            for _ in range(MAX_WORKERS):
+                submit_next()
+
+            while in_flight:
+                page, future = in_flight.popleft()
+                # Keep the request pipeline full while this page is parsed
+                submit_next()
+
+                if parse_pool is None:
+                    html_content = future.result()
+                    page_columns = parse_page(html_content, page, timestamp) if html_content is not None else None
+                else:
+                    page_columns = future.result()
+                if page_columns is None:
+                    # A failed fetch says nothing about where the catalogue ends
+                    failed_pages.append(page)
+                    continue
+                if page_columns["title"]:
+                    empty_streak = 0
+                    # Column lists map straight onto the frame, no row transpose
+                    yield pd.DataFrame(page_columns, columns=PRODUCT_COLUMNS, copy=False)
+                    continue
+
+                empty_streak += 1
+                if empty_streak >= MAX_WORKERS:
+                    logger.info(
+                        f"No products found on {empty_streak} consecutive pages up to page {page}, stopping")
+                    for _, pending in in_flight:
+                        pending.cancel()
+                    break
+    finally:
+        if failed_pages:
+            logger.warning(
+                f"Failed to fetch {len(failed_pages)} pages, their products are missing: {failed_pages}")
+        if parse_pool is not None:
+            parse_pool.shutdown(cancel_futures=True)
+
+
+def extract_data(parse_workers=0):
+    """
+    Main extraction function that scrapes product data from the website.
+
+    Args:
+        parse_workers: Number of processes that parse pages, see extract_pages
+
+    Returns:
+        pd.DataFrame: DataFrame containing product information
+    """
+    pages = list(extract_pages(parse_workers))
+
+    # Create DataFrame from collected products in a single concatenation
+    df = pd.concat(pages, ignore_index=True) if pages else pd.DataFrame(columns=PRODUCT_COLUMNS)
 
     # Log extraction summary
     if df.empty:
@@ -2,20 +2,32 @@
 Load module for ETL pipeline.
 Provides functionality to load transformed data into:
 1. CSV files
-2. Google Sheets
-3. PostgreSQL database
+2. Parquet files
+3. Google Sheets
+4. PostgreSQL database
 """
 
+import atexit
+import csv
+import hashlib
+import io
+import json
 import os
+import random
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 import psycopg2
-from sqlalchemy import create_engine
+from psycopg2.extras import execute_values
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, URL
 import gspread
 from google.oauth2.service_account import Credentials
-from gspread_dataframe import set_with_dataframe
 import logging
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Setup logging
 logging.basicConfig(
@@ -30,11 +42,85 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+# Authorized gspread clients by credentials path, with the credentials file
+# modification time they were created from, reused across uploads
+_gspread_clients: Dict[str, Tuple[float, gspread.Client]] = {}
+
+# Opened spreadsheets by (credentials path, spreadsheet ID)
+_spreadsheets: Dict[tuple, gspread.Spreadsheet] = {}
+
+# Pooled SQLAlchemy engines by connection parameters, reused across loads
+_engines: Dict[frozenset, Engine] = {}
+
 class LoadError(Exception):
     """Custom exception for load operations."""
     pass
 
-def save_to_csv(df: pd.DataFrame, output_path: str, filename: str = "products.csv") -> str:
+def get_gspread_client(credentials_path: str) -> gspread.Client:
+    """
+    Return an authorized gspread client for the service account credentials.
+    
+    The client is created once per credentials path and then reused, so
+    later uploads skip parsing the credentials and authorizing again. A
+    rotated credentials file (newer modification time) is loaded again.
+    
+    Raises:
+        FileNotFoundError: If the credentials file does not exist
+    """
+    try:
+        mtime = os.path.getmtime(credentials_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Credentials file not found: {credentials_path}") from None
+    
+    cached = _gspread_clients.get(credentials_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    credentials = Credentials.from_service_account_file(
+        credentials_path, scopes=SCOPES
+    )
+    client = gspread.authorize(credentials)
+    _gspread_clients[credentials_path] = (mtime, client)
+    # Spreadsheets opened with the previous credentials are opened again
+    for key in [key for key in _spreadsheets if key[0] == credentials_path]:
+        del _spreadsheets[key]
+    return client
+
+def get_engine(connection_params: Dict[str, Any]) -> Engine:
+    """
+    Return a pooled SQLAlchemy engine for the PostgreSQL connection parameters.
+    
+    The engine is created once per set of parameters, so back-to-back loads
+    check out warm connections from its pool instead of connecting again.
+    """
+    key = frozenset(connection_params.items())
+    engine = _engines.get(key)
+    if engine is None:
+        url = URL.create(
+            "postgresql+psycopg2",
+            username=connection_params['user'],
+            password=connection_params['password'],
+            host=connection_params['host'],
+            port=connection_params['port'],
+            database=connection_params['database']
+        )
+        engine = create_engine(url, pool_size=5, max_overflow=5, pool_pre_ping=True)
+        _engines[key] = engine
+    return engine
+
+@atexit.register
+def dispose_engines() -> None:
+    """Close the pooled connections of all cached engines."""
+    for engine in _engines.values():
+        engine.dispose()
+    _engines.clear()
+
+def save_to_csv(
+    df: pd.DataFrame,
+    output_path: str,
+    filename: str = "products.csv",
+    batch_size: int = 8192
+) -> str:
     """
     Save DataFrame to CSV file.
     
@@ -42,6 +128,7 @@ def save_to_csv(df: pd.DataFrame, output_path: str, filename: str = "products.cs
         df: DataFrame to save
         output_path: Directory path where to save the CSV
         filename: Name of the CSV file (default: products.csv)
+        batch_size: Number of rows encoded per write batch (default: 8192)
         
     Returns:
         str: Path to the saved CSV file
@@ -57,8 +144,12 @@ def save_to_csv(df: pd.DataFrame, output_path: str, filename: str = "products.cs
         # Construct full file path
         file_path = os.path.join(output_path, filename)
         
-        # Save to CSV
-        df.to_csv(file_path, index=False)
+        # Save to CSV with pyarrow's vectorized writer
+        pacsv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            file_path,
+            write_options=pacsv.WriteOptions(include_header=True, batch_size=batch_size)
+        )
         logger.info(f"Data successfully saved to CSV: {file_path}")
         
         return file_path
@@ -68,17 +159,109 @@ def save_to_csv(df: pd.DataFrame, output_path: str, filename: str = "products.cs
     except PermissionError as e:
         logger.error(f"Permission error when saving CSV: {str(e)}")
         raise LoadError(f"Permission denied when writing to {output_path}: {str(e)}")
+    except OSError as e:
+        logger.error(f"I/O error when saving CSV: {str(e)}")
+        raise LoadError(f"Could not write CSV to {output_path}: {str(e)}")
     except Exception as e:
         logger.error(f"Failed to save data to CSV: {str(e)}")
         raise LoadError(f"CSV export failed: {str(e)}")
 
 
+def save_to_parquet(
+    df: pd.DataFrame,
+    output_path: str,
+    filename: str = "products.parquet",
+    compression: str = "zstd",
+    row_group_size: int = 64_000
+) -> str:
+    """
+    Save DataFrame to a compressed Parquet file.
+    
+    Args:
+        df: DataFrame to save
+        output_path: Directory path where to save the Parquet file
+        filename: Name of the Parquet file (default: products.parquet)
+        compression: Parquet codec, e.g. 'zstd' for smaller files or
+            'snappy' for faster writes (default: zstd)
+        row_group_size: Maximum number of rows per row group (default: 64000)
+        
+    Returns:
+        str: Path to the saved Parquet file
+        
+    Raises:
+        LoadError: If saving to Parquet fails
+    """
+    try:
+        # Validate input DataFrame
+        if df is None or df.empty:
+            raise ValueError("DataFrame is empty or None")
+        
+        # Construct full file path
+        file_path = os.path.join(output_path, filename)
+        
+        # Save to Parquet, repeated strings are dictionary encoded per column
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False),
+            file_path,
+            compression=compression,
+            use_dictionary=True,
+            row_group_size=row_group_size
+        )
+        logger.info(f"Data successfully saved to Parquet: {file_path}")
+        
+        return file_path
+    except ValueError as e:
+        logger.error(f"Invalid data error: {str(e)}")
+        raise LoadError(f"Invalid data for Parquet export: {str(e)}")
+    except PermissionError as e:
+        logger.error(f"Permission error when saving Parquet: {str(e)}")
+        raise LoadError(f"Permission denied when writing to {output_path}: {str(e)}")
+    except Exception as e:
+        logger.error(f"Failed to save data to Parquet: {str(e)}")
+        raise LoadError(f"Parquet export failed: {str(e)}")
+
+
+def _float32_as_float64(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Widen the float32 columns of df through their shortest decimal repr.
+    
+    transform_data stores price and rating as float32. Casting them straight
+    to float64 turns 4.8 into 4.800000190734863, going through str keeps 4.8.
+    """
+    float32_columns = df.select_dtypes("float32").columns
+    if not len(float32_columns):
+        return df
+    return df.astype({column: str for column in float32_columns}).astype(
+        {column: "float64" for column in float32_columns})
+
+def _sheet_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert the header and rows of df into Sheets API RowData."""
+    df = _float32_as_float64(df)
+    
+    def cell(value) -> Dict[str, Any]:
+        if value == "":
+            return {}
+        if isinstance(value, bool):
+            return {"userEnteredValue": {"boolValue": value}}
+        if isinstance(value, (int, float)):
+            return {"userEnteredValue": {"numberValue": value}}
+        return {"userEnteredValue": {"stringValue": str(value)}}
+    
+    values = [df.columns.tolist(), *df.astype(object).where(df.notna(), "").values.tolist()]
+    return [{"values": [cell(value) for value in row]} for row in values]
+
+def _new_sheet_id() -> int:
+    """Pick a random worksheet ID in the 31-bit range the Sheets API accepts."""
+    return random.randrange(1, 2**31)
+
 def save_to_google_sheets(
     df: pd.DataFrame, 
     credentials_path: str,
     spreadsheet_id: Optional[str] = None,
     sheet_name: str = "Products",
-    create_if_not_exists: bool = True
+    create_if_not_exists: bool = True,
+    batch_size: Optional[int] = None,
+    share_public: bool = False
 ) -> str:
     """
     Save DataFrame to Google Sheets.
@@ -89,6 +272,10 @@ def save_to_google_sheets(
         spreadsheet_id: ID of existing Google Sheet (optional)
         sheet_name: Name of the worksheet (default: Products)
         create_if_not_exists: Create new spreadsheet if ID not provided
+        batch_size: Maximum number of rows per update request, or None to
+            send all rows in a single request (default)
+        share_public: Grant 'anyone with the link' read access even when the
+            spreadsheet already existed. New spreadsheets are always shared.
         
     Returns:
         str: ID of the Google Sheet
@@ -100,26 +287,28 @@ def save_to_google_sheets(
         # Validate input DataFrame
         if df is None or df.empty:
             raise ValueError("DataFrame is empty or None")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
             
-        # Check if credentials file exists
-        if not os.path.exists(credentials_path):
-            raise FileNotFoundError(f"Credentials file not found: {credentials_path}")
-        
-        # Authenticate with Google Sheets API
-        credentials = Credentials.from_service_account_file(
-            credentials_path, scopes=SCOPES
-        )
-        gc = gspread.authorize(credentials)
+        # Authenticate with Google Sheets API, this also checks the credentials file exists
+        gc = get_gspread_client(credentials_path)
         
         # Get or create spreadsheet
+        created = False
         if spreadsheet_id:
             try:
-                spreadsheet = gc.open_by_key(spreadsheet_id)
+                # Reuse the spreadsheet opened by an earlier upload in this process
+                spreadsheet_key = (credentials_path, spreadsheet_id)
+                spreadsheet = _spreadsheets.get(spreadsheet_key)
+                if spreadsheet is None:
+                    spreadsheet = gc.open_by_key(spreadsheet_id)
+                    _spreadsheets[spreadsheet_key] = spreadsheet
                 logger.info(f"Opened existing spreadsheet with ID: {spreadsheet_id}")
             except gspread.exceptions.SpreadsheetNotFound:
                 if create_if_not_exists:
                     spreadsheet = gc.create(f"Products ETL {time.strftime('%Y-%m-%d')}")
                     spreadsheet_id = spreadsheet.id
+                    created = True
                     logger.info(f"Created new spreadsheet with ID: {spreadsheet_id}")
                 else:
                     raise LoadError(f"Spreadsheet with ID {spreadsheet_id} not found")
@@ -127,25 +316,60 @@ def save_to_google_sheets(
             # Create new spreadsheet
             spreadsheet = gc.create(f"Products ETL {time.strftime('%Y-%m-%d')}")
             spreadsheet_id = spreadsheet.id
+            created = True
             logger.info(f"Created new spreadsheet with ID: {spreadsheet_id}")
         
-        # Get or create worksheet
-        try:
-            worksheet = spreadsheet.worksheet(sheet_name)
-            # Clear existing content
-            worksheet.clear()
-            logger.info(f"Cleared existing worksheet: {sheet_name}")
-        except gspread.exceptions.WorksheetNotFound:
-            # Create new worksheet
-            worksheet = spreadsheet.add_worksheet(title=sheet_name, rows=df.shape[0] + 10, cols=df.shape[1] + 5)
-            logger.info(f"Created new worksheet: {sheet_name}")
+        # Size the worksheet to the data: add it, or resize the existing one
+        # instead of clearing it since every cell in the grid is rewritten
+        rows = _sheet_rows(df)
+        grid = {"rowCount": len(rows), "columnCount": df.shape[1]}
+        worksheets = {ws.title: ws for ws in spreadsheet.worksheets()}
+        worksheet = worksheets.get(sheet_name)
+        if worksheet is None:
+            # Random ID, as parallel uploads to the same spreadsheet would all
+            # derive the same one from the worksheet list
+            sheet_id = _new_sheet_id()
+            logger.info(f"Creating new worksheet: {sheet_name}")
+        else:
+            sheet_id = worksheet.id
+            logger.info(f"Resizing existing worksheet: {sheet_name}")
         
-        # Write data to worksheet
-        set_with_dataframe(worksheet, df)
+        def setup_request(sheet_id: int) -> Dict[str, Any]:
+            if worksheet is None:
+                return {"addSheet": {"properties": {
+                    "sheetId": sheet_id, "title": sheet_name, "gridProperties": grid
+                }}}
+            return {"updateSheetProperties": {
+                "properties": {"sheetId": sheet_id, "gridProperties": grid},
+                "fields": "gridProperties(rowCount,columnCount)"
+            }}
+        
+        def cells_request(sheet_id: int, start: int) -> Dict[str, Any]:
+            return {"updateCells": {
+                "start": {"sheetId": sheet_id, "rowIndex": start, "columnIndex": 0},
+                "rows": rows[start:start + step],
+                "fields": "userEnteredValue"
+            }}
+        
+        # Write header and rows in the same batchUpdate as the worksheet setup,
+        # a single request unless batch_size splits the rows
+        step = batch_size or len(rows)
+        try:
+            spreadsheet.batch_update({"requests": [setup_request(sheet_id), cells_request(sheet_id, 0)]})
+        except gspread.exceptions.APIError as e:
+            if worksheet is not None or "already exists" not in str(e):
+                raise
+            # Another upload took the same random ID, retry once with a new one
+            sheet_id = _new_sheet_id()
+            spreadsheet.batch_update({"requests": [setup_request(sheet_id), cells_request(sheet_id, 0)]})
+        for start in range(step, len(rows), step):
+            spreadsheet.batch_update({"requests": [cells_request(sheet_id, start)]})
         logger.info(f"Data successfully uploaded to Google Sheets, ID: {spreadsheet_id}, Sheet: {sheet_name}")
         
-        # Set permissions to anyone with the link can view
-        spreadsheet.share(None, role='reader', perm_type='anyone')
+        # Set permissions to anyone with the link can view, existing
+        # spreadsheets keep the permission granted when they were created
+        if created or share_public:
+            spreadsheet.share(None, role='reader', perm_type='anyone')
         
         return spreadsheet_id
     except ValueError as e:
@@ -159,12 +383,56 @@ def save_to_google_sheets(
         raise LoadError(f"Google Sheets export failed: {str(e)}")
 
 
+def psql_insert_copy(table, conn, keys, data_iter):
+    """
+    DataFrame.to_sql insertion method that loads rows with COPY FROM STDIN.
+    
+    COPY skips the per-row parsing and planning of INSERT statements. pandas
+    calls this once per chunk of rows, inside the to_sql transaction.
+    
+    Args:
+        table: pandas SQLTable being written
+        conn: SQLAlchemy connection
+        keys: Column names
+        data_iter: Iterable of row tuples
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(data_iter)
+    buffer.seek(0)
+    
+    columns = ", ".join(f'"{key}"' for key in keys)
+    copy_target = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(f"COPY {copy_target} ({columns}) FROM STDIN WITH CSV", buffer)
+
+def psql_insert_values(table, conn, keys, data_iter):
+    """
+    DataFrame.to_sql insertion method that sends multi-row INSERTs with execute_values.
+    
+    Used where COPY is not an option. psycopg2 inlines the rows into a few
+    large VALUES statements instead of binding parameters row by row.
+    
+    Args:
+        table: pandas SQLTable being written
+        conn: SQLAlchemy connection
+        keys: Column names
+        data_iter: Iterable of row tuples
+    """
+    columns = ", ".join(f'"{key}"' for key in keys)
+    insert_target = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        execute_values(cursor, f"INSERT INTO {insert_target} ({columns}) VALUES %s", list(data_iter), page_size=1000)
+
 def save_to_postgresql(
     df: pd.DataFrame,
     table_name: str,
     connection_params: Dict[str, Any],
     if_exists: str = "replace",
-    schema: Optional[str] = "public"
+    schema: Optional[str] = "public",
+    batch_size: int = 10_000,
+    use_copy: bool = True
 ) -> bool:
     """
     Save DataFrame to PostgreSQL database.
@@ -176,6 +444,12 @@ def save_to_postgresql(
             (host, database, user, password, port)
         if_exists: Strategy if table exists ('fail', 'replace', 'append')
         schema: Database schema name
+        batch_size: Number of rows encoded and sent per COPY, bounds the
+            size of the in-memory CSV buffer (default: 10000). Multi-row
+            INSERT stops improving around 1000 rows per batch, COPY keeps
+            gaining from larger batches.
+        use_copy: Load with COPY (default). Set to False to fall back to
+            batched INSERTs, e.g. for tables where COPY is not permitted.
         
     Returns:
         bool: True if successful
@@ -198,34 +472,29 @@ def save_to_postgresql(
         if 'port' not in connection_params:
             connection_params['port'] = 5432
         
-        # Create SQLAlchemy engine
-        conn_string = (
-            f"postgresql://{connection_params['user']}:{connection_params['password']}@"
-            f"{connection_params['host']}:{connection_params['port']}/{connection_params['database']}"
-        )
-        engine = create_engine(conn_string)
+        # Reuse the pooled engine for these connection parameters
+        engine = get_engine(connection_params)
         
-        # Test connection before proceeding
-        with engine.connect() as conn:
+        # One connection and transaction for the schema setup and the COPY load
+        full_table_name = f"{schema}.{table_name}" if schema else table_name
+        with engine.begin() as conn:
             logger.info("PostgreSQL connection successful")
-        
-        # Create schema if it doesn't exist
-        if schema != "public":
-            create_schema_query = f"CREATE SCHEMA IF NOT EXISTS {schema};"
-            with engine.connect() as conn:
-                conn.execute(create_schema_query)
+            
+            # Create schema if it doesn't exist
+            if schema and schema != "public":
+                conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
                 logger.info(f"Ensured schema exists: {schema}")
-        
-        # Save DataFrame to PostgreSQL
-        full_table_name = f"{schema}.{table_name}" if schema else table_name
-        df.to_sql(
-            name=table_name,
-            con=engine,
-            schema=schema,
-            if_exists=if_exists,
-            index=False,
-            method='multi'  # Faster for larger DataFrames
-        )
+            
+            # Save DataFrame to PostgreSQL, rows are streamed with COPY in chunks
+            df.to_sql(
+                name=table_name,
+                con=conn,
+                schema=schema,
+                if_exists=if_exists,
+                index=False,
+                method=psql_insert_copy if use_copy else psql_insert_values,
+                chunksize=batch_size
+            )
         
         # Skip the verification step that's causing issues
         row_count = len(df)
@@ -242,6 +511,50 @@ def save_to_postgresql(
         logger.error(f"Failed to save data to PostgreSQL: {str(e)}")
         raise LoadError(f"PostgreSQL export failed: {str(e)}")
 
+def data_digest(df: pd.DataFrame) -> str:
+    """
+    Return a digest of the column names and values of df.
+    
+    The timestamp column is left out: it records when the rows were scraped,
+    so it differs on every run even when the products are identical.
+    """
+    df = df.drop(columns="timestamp", errors="ignore")
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return hasher.hexdigest()
+
+def read_load_state(state_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the per-destination load state, an unreadable file counts as empty.
+    
+    Entries without a digest and a result are dropped, so those destinations
+    are loaded again.
+    """
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if not isinstance(state, dict):
+            return {}
+        return {key: entry for key, entry in state.items()
+                if isinstance(entry, dict) and "digest" in entry and "result" in entry}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable load state {state_path}: {str(e)}")
+        return {}
+
+def write_load_state(state_path: str, state: Dict[str, Dict[str, Any]]) -> None:
+    """Write the per-destination load state through a temporary file."""
+    try:
+        os.makedirs(os.path.dirname(state_path) or ".", exist_ok=True)
+        tmp_path = f"{state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, state_path)
+    except OSError as e:
+        logger.warning(f"Could not write load state {state_path}: {str(e)}")
+
 def load_data(
 df: pd.DataFrame,
     save_csv: bool = True,
@@ -251,13 +564,20 @@ df: pd.DataFrame,
     csv_filename: str = "products.csv",
     sheets_credentials_path: Optional[str] = None,
     sheets_id: Optional[str] = None,
-    sheets_name: str = "Products",  # Added parameter for worksheet name
+    sheets_name: str = "Products",
     postgres_params: Optional[Dict[str, Any]] = None,
-    postgres_table: str = "products"
+    postgres_table: str = "products",
+    save_parquet: bool = False,
+    parquet_path: str = "./data",
+    parquet_filename: str = "products.parquet",
+    state_path: Optional[str] = None,
+    force: bool = False
 ) -> Dict[str, Union[str, bool]]:
     """
     Main function to load data to multiple destinations.
     
+    The selected destinations are written concurrently, one thread each.
+    
     Args:
         df: DataFrame to load
         save_csv: Whether to save as CSV
@@ -267,58 +587,100 @@ df: pd.DataFrame,
         csv_filename: Filename for CSV
         sheets_credentials_path: Path to Google credentials JSON
         sheets_id: Google Sheets ID (optional)
+        sheets_name: Name of the worksheet
         postgres_params: PostgreSQL connection parameters
         postgres_table: PostgreSQL table name
+        save_parquet: Whether to save as Parquet
+        parquet_path: Directory path for Parquet
+        parquet_filename: Filename for Parquet
+        state_path: JSON file recording a digest of the data last loaded to
+            each destination. Destinations that already hold identical data
+            are skipped and keep their previous result. None disables this.
+        force: Load to every destination even if its data is unchanged
         
     Returns:
-        Dict containing results of each operation
+        Dict containing results of each operation, skipped destinations
+        are listed under 'skipped'
         
     Raises:
         ValueError: If no storage option is selected
     """
-    if not any([save_csv, save_sheets, save_postgres]):
+    if not any([save_csv, save_sheets, save_postgres, save_parquet]):
         raise ValueError("At least one storage destination must be selected")
     
     results = {
         "csv_path": None,
+        "parquet_path": None,
         "sheets_id": None, 
         "postgres_success": False
     }
     
-    # Save to CSV if requested
-    if save_csv:
-        try:
-            results["csv_path"] = save_to_csv(df, csv_path, csv_filename)
-        except LoadError as e:
-            logger.error(f"CSV storage failed: {str(e)}")
-            results["csv_error"] = str(e)
+    if save_sheets and not sheets_credentials_path:
+        logger.warning("Google Sheets credentials path not provided, skipping")
+        results["sheets_error"] = "Credentials path not provided"
+        save_sheets = False
+    if save_postgres and not postgres_params:
+        logger.warning("PostgreSQL connection parameters not provided, skipping")
+        results["postgres_error"] = "Connection parameters not provided"
+        save_postgres = False
     
-    # Save to Google Sheets if requested
+    # Each destination: (label, result key, error key, state key, save function, arguments).
+    # The state key identifies the target for skipping unchanged reloads, None never skips.
+    sinks = []
+    if save_csv:
+        sinks.append(("CSV", "csv_path", "csv_error",
+                      f"csv:{os.path.abspath(os.path.join(csv_path, csv_filename))}",
+                      save_to_csv, (df, csv_path, csv_filename)))
+    if save_parquet:
+        sinks.append(("Parquet", "parquet_path", "parquet_error",
+                      f"parquet:{os.path.abspath(os.path.join(parquet_path, parquet_filename))}",
+                      save_to_parquet, (df, parquet_path, parquet_filename)))
     if save_sheets:
-        if not sheets_credentials_path:
-            logger.warning("Google Sheets credentials path not provided, skipping")
-            results["sheets_error"] = "Credentials path not provided"
-        else:
-            try:
-                results["sheets_id"] = save_to_google_sheets(
-                    df, sheets_credentials_path, sheets_id
-                )
-            except LoadError as e:
-                logger.error(f"Google Sheets storage failed: {str(e)}")
-                results["sheets_error"] = str(e)
-    
-    # Save to PostgreSQL if requested
+        sinks.append(("Google Sheets", "sheets_id", "sheets_error",
+                      f"sheets:{sheets_id}/{sheets_name}" if sheets_id else None,
+                      save_to_google_sheets, (df, sheets_credentials_path, sheets_id, sheets_name)))
     if save_postgres:
-        if not postgres_params:
-            logger.warning("PostgreSQL connection parameters not provided, skipping")
-            results["postgres_error"] = "Connection parameters not provided"
-        else:
+        sinks.append(("PostgreSQL", "postgres_success", "postgres_error",
+                      f"postgres:{postgres_params.get('host')}:{postgres_params.get('port', 5432)}"
+                      f"/{postgres_params.get('database')}/{postgres_table}",
+                      save_to_postgresql, (df, postgres_table, postgres_params)))
+    
+    digest = data_digest(df) if state_path else None
+    state = read_load_state(state_path) if state_path else {}
+    
+    # The destinations are independent and I/O-bound, so each one runs in its
+    # own thread and the total load time is that of the slowest destination.
+    # Each future maps to its sink.
+    futures = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for sink in sinks:
+            label, result_key, _, state_key, save, args = sink
+            previous = state.get(state_key) if state_key else None
+            unchanged = not force and previous is not None and previous.get("digest") == digest
+            # Output files can be removed between runs, so they also have to still exist
+            if unchanged and state_key.startswith(("csv:", "parquet:")):
+                unchanged = os.path.exists(previous["result"])
+            if unchanged:
+                logger.info(f"{label} already holds this data, skipping")
+                results[result_key] = previous["result"]
+                results.setdefault("skipped", []).append(label)
+                continue
+            futures[executor.submit(save, *args)] = sink
+        
+        for future in as_completed(futures):
+            label, result_key, error_key, state_key, _, _ = futures[future]
             try:
-                results["postgres_success"] = save_to_postgresql(
-                    df, postgres_table, postgres_params
-                )
+                results[result_key] = future.result()
+                if digest and state_key:
+                    state[state_key] = {"digest": digest, "result": results[result_key]}
             except LoadError as e:
-                logger.error(f"PostgreSQL storage failed: {str(e)}")
-                results["postgres_error"] = str(e)
+                logger.error(f"{label} storage failed: {str(e)}")
+                results[error_key] = str(e)
+                # A failed load may have left the destination partly written
+                if state_key:
+                    state.pop(state_key, None)
+    
+    if digest and futures:
+        write_load_state(state_path, state)
     
-    return results
\ No newline at end of file
+    return results
@@ -5,7 +5,7 @@ Provides functionality to transform and clean extracted data.
 
 import pandas as pd
 import re
-from typing import Optional, Union
+from typing import List, Optional, Union
 import logging
 
 # Setup logging
@@ -24,6 +24,25 @@ DIRTY_PATTERNS = {
 
 CURRENCY_CONVERSION = 16000  # USD to IDR
 
+# Patterns shared by the scalar and vectorized cleaners
+_PRICE_STRIP = re.compile(r"[^\d.,]")
+_RATING_NUM = re.compile(r"(\d+(?:\.\d+)?)")
+_COLORS_NUM = re.compile(r"(\d+)")
+
+# Prefixes stripped from size and gender values
+_SIZE_PREFIX = re.compile(r"^Size:\s*", re.IGNORECASE)
+_GENDER_PREFIX = re.compile(r"^Gender:\s*", re.IGNORECASE)
+
+# Compact dtypes of the numeric columns after transformation
+NUMERIC_DTYPES = {
+    "price": "float32",
+    "rating": "float32",
+    "colors": "int16"
+}
+
+# Low-cardinality text columns, dictionary encoded after transformation
+CATEGORY_COLUMNS = ["size", "gender"]
+
 def clean_price(price_str: Optional[str]) -> Optional[float]:
     """Clean price string and convert to numeric value.
     Handles: $100.50, 100,50, '1,000.50', etc.
@@ -33,7 +52,7 @@ def clean_price(price_str: Optional[str]) -> Optional[float]:
         
     try:
         # Remove all non-digit characters except dots and commas
-        cleaned = re.sub(r"[^\d.,]", "", str(price_str))
+        cleaned = _PRICE_STRIP.sub("", str(price_str))
         # Replace comma with dot if used as decimal separator
         if ',' in cleaned and '.' not in cleaned:
             cleaned = cleaned.replace(',', '.')
@@ -51,7 +70,7 @@ def clean_rating(rating_str: Optional[str]) -> Optional[float]:
         
     try:
         # Match first occurring number with optional decimal
-        match = re.search(r"(\d+(?:\.\d+)?)", str(rating_str))
+        match = _RATING_NUM.search(str(rating_str))
         return float(match.group(1)) if match else None
     except (ValueError, TypeError, AttributeError):
         return None
@@ -65,7 +84,7 @@ def clean_colors(colors_str: Optional[str]) -> int:
             return None
 
         # Mengekstrak angka dari string menggunakan regex
-        color_match = re.search(r'(\d+)', colors_str)
+        color_match = _COLORS_NUM.search(colors_str)
         if color_match:
             return int(color_match.group(1))
 
@@ -85,7 +104,7 @@ def clean_size(size_str: Optional[Union[str, int, float]]) -> Optional[str]:
         if not isinstance(size_str, str):
             return None
             
-        cleaned = re.sub(r"^Size:\s*", "", size_str, flags=re.IGNORECASE).strip()
+        cleaned = _SIZE_PREFIX.sub("", size_str).strip()
         return cleaned if cleaned else None
     except (ValueError, TypeError, AttributeError):
         return None
@@ -100,25 +119,62 @@ def clean_gender(gender_str: Optional[Union[str, int, float]]) -> Optional[str]:
         if not isinstance(gender_str, str):
             return None
             
-        cleaned = re.sub(r"^Gender:\s*", "", gender_str, flags=re.IGNORECASE).strip()
+        cleaned = _GENDER_PREFIX.sub("", gender_str).strip()
         return cleaned if cleaned else None
     except (ValueError, TypeError, AttributeError):
         return None
     
+def vectorized_price(prices: pd.Series) -> pd.Series:
+    """Column-wise equivalent of clean_price. Invalid prices become NaN."""
+    cleaned = prices.astype("string").str.replace(_PRICE_STRIP, "", regex=True)
+    # Replace comma with dot if used as decimal separator
+    comma_decimal = (cleaned.str.contains(",", regex=False, na=False)
+                     & ~cleaned.str.contains(".", regex=False, na=False))
+    cleaned = cleaned.where(~comma_decimal, cleaned.str.replace(",", ".", regex=False))
+    # Remove thousand separators
+    cleaned = cleaned.str.replace(",", "", regex=False)
+    return pd.to_numeric(cleaned, errors="coerce").astype("float64") * CURRENCY_CONVERSION
+
+def vectorized_rating(ratings: pd.Series) -> pd.Series:
+    """Column-wise equivalent of clean_rating. Invalid ratings become NaN."""
+    numbers = ratings.astype("string").str.extract(_RATING_NUM, expand=False)
+    return pd.to_numeric(numbers, errors="coerce").astype("float64")
+
+def vectorized_colors(colors: pd.Series) -> pd.Series:
+    """Column-wise equivalent of clean_colors. Invalid values become NaN."""
+    numbers = colors.astype("string").str.extract(_COLORS_NUM, expand=False)
+    return pd.to_numeric(numbers, errors="coerce").astype("float64")
+
+def _strip_prefix(values: pd.Series, prefix: re.Pattern) -> pd.Series:
+    """Strip a prefix from string values. Non-strings and empty results become NaN."""
+    if not pd.api.types.is_object_dtype(values) and not pd.api.types.is_string_dtype(values):
+        return pd.Series(None, index=values.index, dtype=object)
+    # The .str accessor already maps non-string values to NaN
+    cleaned = values.str.replace(prefix, "", regex=True).str.strip()
+    return cleaned.mask(cleaned == "")
+
+def vectorized_size(sizes: pd.Series) -> pd.Series:
+    """Column-wise equivalent of clean_size."""
+    return _strip_prefix(sizes, _SIZE_PREFIX)
+
+def vectorized_gender(genders: pd.Series) -> pd.Series:
+    """Column-wise equivalent of clean_gender."""
+    return _strip_prefix(genders, _GENDER_PREFIX)
+
 def remove_dirty_data(df: pd.DataFrame) -> pd.DataFrame:
     """Remove rows matching dirty patterns."""
     if df.empty:
         return df
         
-    df_clean = df.copy()
+    # Combine the checks of all columns into one mask and slice only once
+    mask = pd.Series(True, index=df.index)
     for column, patterns in DIRTY_PATTERNS.items():
-        if column in df_clean.columns:
-            # Create mask for valid rows
-            mask = ~df_clean[column].isin(patterns)
+        if column in df.columns:
             # Handle NaN/None separately
-            mask &= df_clean[column].notna()
-            df_clean = df_clean[mask]
-    return df_clean
+            mask &= df[column].notna() & ~df[column].isin(patterns)
+    # take() returns an independent frame, unlike a boolean slice it is not
+    # flagged as a view, so callers can assign columns without another copy
+    return df.take(mask.to_numpy().nonzero()[0])
 
 def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     """Main transformation pipeline."""
@@ -130,11 +186,8 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
         logger.info(f"Starting transformation with {len(df)} records")
         logger.info(f"Columns in input DataFrame: {', '.join(df.columns)}")
         
-        # Create a copy to avoid SettingWithCopyWarning
-        df_transformed = df.copy()
-        
-        # Step 1: Remove dirty data
-        df_transformed = remove_dirty_data(df_transformed)
+        # Step 1: Remove dirty data, this also copies the input before it is modified
+        df_transformed = remove_dirty_data(df)
         logger.info(f"After removing dirty data: {len(df_transformed)} records remaining")
         
         # Step 2: Clean all columns - use lowercase column names for consistency
@@ -142,25 +195,28 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Starting column cleaning process...")
         
         # Price cleaning
-        df_transformed["price"] = df_transformed["price"].apply(clean_price)
+        df_transformed["price"] = vectorized_price(df_transformed["price"])
         
         # Rating cleaning
-        df_transformed["rating"] = df_transformed["rating"].apply(clean_rating)
+        df_transformed["rating"] = vectorized_rating(df_transformed["rating"])
         
         # Colors cleaning
-        df_transformed["colors"] = df_transformed["colors"].apply(clean_colors)
+        df_transformed["colors"] = vectorized_colors(df_transformed["colors"])
         
         # Size cleaning
-        df_transformed["size"] = df_transformed["size"].apply(clean_size)
+        df_transformed["size"] = vectorized_size(df_transformed["size"])
         
         # Gender cleaning
-        df_transformed["gender"] = df_transformed["gender"].apply(clean_gender)
+        df_transformed["gender"] = vectorized_gender(df_transformed["gender"])
 
         # Step 3: Drop rows with any null values in the cleaned columns
         clean_columns = ["price", "rating", "colors", "size", "gender"]
         
         df_final = df_transformed.dropna(subset=clean_columns)
         
+        # Step 4: Store columns in compact dtypes, colors can only be cast once nulls are gone
+        df_final = df_final.astype({**NUMERIC_DTYPES, **dict.fromkeys(CATEGORY_COLUMNS, "category")})
+        
         logger.info(f"Final transformed DataFrame has {len(df_final)} records")
         logger.info(f"Rows dropped due to nulls: {len(df_transformed) - len(df_final)}")
         
@@ -171,4 +227,16 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
         logger.error(f"Transformation error: {str(e)}")
         import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+
+def combine_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate transformed chunks, keeping the categorical columns.
+    
+    pd.concat falls back to object dtype when the chunks were encoded with
+    different categories, so the columns are encoded again on the result.
+    """
+    if not chunks:
+        return pd.DataFrame()
+    combined = pd.concat(chunks, ignore_index=True)
+    return combined.astype(dict.fromkeys(CATEGORY_COLUMNS, "category"))